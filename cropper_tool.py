@@ -6,40 +6,42 @@ and options. It allows users to select a region of interest and save the cropped
 image in different formats.
 """
 import os
-from pathlib import Path
+import hashlib
 from typing import Tuple, Optional
 import traceback
 import numpy as np
-from PIL import Image
 
-# Import PyQt5 modules
+# Import PyQt5 modules (only the names this module uses)
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QFileDialog, QComboBox, QGroupBox, 
-    QRadioButton, QButtonGroup, QSizePolicy, QScrollArea, 
-    QGridLayout, QFrame, QCheckBox, QSpinBox, QProgressBar,
-    QMessageBox, QSizeGrip, QApplication, QStyle, 
-    QStyleOptionSlider, QToolTip, QToolButton, QSplitter, 
-    QTabWidget, QLabel, QLineEdit
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QFileDialog, QComboBox, QGroupBox,
+    QRadioButton, QButtonGroup, QAbstractButton, QSizePolicy, QScrollArea,
+    QGridLayout, QFrame, QCheckBox, QSpinBox, QLabel, QLineEdit, QMessageBox
 )
 from PyQt5.QtCore import (
-    Qt, QPoint, QRect, QRectF, QSize, pyqtSignal, QPointF, QTimer,
-    QThread, QObject, QEvent, QMarginsF, QBuffer, QByteArray, # Ensure QBuffer and QByteArray are here
-    QUrl, QMimeData, QStandardPaths, QFileInfo, QDir, 
-    QCoreApplication
+    Qt, QPoint, QRect, QRectF, QLine, QSize, pyqtSignal, QTimer,
+    QObject, QRunnable, QThreadPool, QStandardPaths, pyqtSlot
 )
 from PyQt5.QtGui import (
-    QPixmap, QImage, QPainter, QPen, QColor, QImageReader,
-    QCursor, QIcon, QFont, QFontMetrics, QPainterPath, QBrush, QMouseEvent, QTransform
+    QPixmap, QImage, QImageReader, QImageWriter, QPainter, QPen, QColor,
+    QIcon, QBrush, QMouseEvent, QTransform, QGuiApplication,
+    QPixmapCache
 )
 
+# Numba is optional and only used to JIT the crop-box arithmetic
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Import PIL for image processing
 try:
-    from PIL import Image, ImageQt
+    from PIL import Image
 except ImportError as e:
     raise ImportError(
         f"Failed to import required modules: {e}\n"
-        "Please make sure Pillow is installed with Qt support:\n"
+        "Please make sure Pillow is installed:\n"
         "pip install pillow pyqt5"
     )
 
@@ -48,60 +50,339 @@ CROPPER_THUMB_IMG_HEIGHT = 120 # For the image part of the new thumbnail item
 CROPPER_THUMB_ITEM_WIDTH = 140 # Overall width of the thumbnail item widget
 CROPPER_THUMB_ITEM_HEIGHT = 170 # Overall height of the thumbnail item widget
 THUMBNAIL_GRID_COLUMNS = 4 # Number of columns in the thumbnail grid
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024 # QPixmapCache budget for full-resolution crop sources
+THUMB_DISK_CACHE_QUALITY = 70 # Quality for thumbnails written to the on-disk cache
+SAVE_BUFFER_SIZE = 1 << 20 # Write buffer for saved crops
+
+_thumb_cache_dir = None # Resolved on first use by thumb_disk_cache_path()
+_thumb_cache_ext = "png" # WebP when the Qt image plugin is available
+
+
+def _compute_crop_box(img_left, img_top, img_width, img_height, aspect, min_size):
+    """Return (start_x, start_y, end_x, end_y) of a crop box centred in the image rect.
+
+    The box covers 80% of the limiting image dimension, follows ``aspect``
+    (width / height, 0 for a square free-form box) and is at least
+    ``min_size`` on each side.
+    """
+    if aspect > 0:
+        if img_width / aspect <= img_height:
+            crop_width = img_width * 0.8  # Default to 80% of image width
+            crop_height = crop_width / aspect
+        else:
+            crop_height = img_height * 0.8  # Default to 80% of image height
+            crop_width = crop_height * aspect
+    else:  # Free form, default to 80% of the smaller dimension
+        crop_width = min(img_width, img_height) * 0.8
+        crop_height = crop_width
+
+    # Centre within the image, keeping the top-left corner inside it
+    start_x = max(img_left * 1.0, img_left + img_width / 2 - crop_width / 2)
+    start_y = max(img_top * 1.0, img_top + img_height / 2 - crop_height / 2)
+
+    crop_width = max(crop_width, min_size)
+    crop_height = max(crop_height, min_size)
+    return int(start_x), int(start_y), int(start_x + crop_width), int(start_y + crop_height)
+
+
+def _compute_resized_end(start_x, start_y, width, height, dw, dh, aspect, min_dim):
+    """Return the new (end_x, end_y) after growing a top-left anchored box by (dw, dh)."""
+    new_width = max(min_dim, width + dw * 1.0)
+    new_height = max(min_dim, height + dh * 1.0)
+
+    if aspect > 0:
+        if dw != 0:  # Width changed primarily
+            new_height = new_width / aspect
+        elif dh != 0:  # Height changed primarily
+            new_width = new_height * aspect
+
+    return int(round(start_x + new_width)), int(round(start_y + new_height))
+
+
+if NUMBA_AVAILABLE:
+    # Compile the pure-number helpers; cache=True keeps the compiled code on disk
+    _compute_crop_box = njit(cache=True)(_compute_crop_box)
+    _compute_resized_end = njit(cache=True)(_compute_resized_end)
+
+def thumb_disk_cache_path(cache_key: str) -> Optional[str]:
+    """Return the on-disk cache file for a thumbnail cache key, or None if unavailable.
+
+    Files live under <CacheLocation>/thumbs/ and are named by the SHA-1 of the
+    key, which already encodes the path, mtime and thumbnail size.
+    """
+    global _thumb_cache_dir, _thumb_cache_ext
+    if _thumb_cache_dir is None:
+        if b"webp" in QImageWriter.supportedImageFormats():
+            _thumb_cache_ext = "webp"
+        base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        _thumb_cache_dir = os.path.join(base, "thumbs") if base else ""
+        if _thumb_cache_dir:
+            try:
+                os.makedirs(_thumb_cache_dir, exist_ok=True)
+            except OSError:
+                _thumb_cache_dir = ""
+    if not _thumb_cache_dir or not cache_key:
+        return None
+    digest = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+    return os.path.join(_thumb_cache_dir, f"{digest}.{_thumb_cache_ext}")
+
+
+def read_scaled_image(image_path: str, max_size: Optional[QSize] = None) -> Tuple[QImage, float]:
+    """Decode an image no larger than max_size (aspect kept) with QImageReader.
+
+    The scaled size is requested before reading, so the JPEG plugin can use a
+    scaled IDCT rather than decoding full resolution. Returns the image and
+    the source-pixels-per-image-pixel factor; the image is null if Qt cannot
+    read the file.
+    """
+    reader = QImageReader(image_path)
+    full_size = reader.size()
+    if (max_size is not None and full_size.isValid()
+            and (full_size.width() > max_size.width() or full_size.height() > max_size.height())):
+        reader.setScaledSize(full_size.scaled(max_size, Qt.KeepAspectRatio))
+    qimage = reader.read()
+    if qimage.isNull() or not full_size.isValid():
+        return qimage, 1.0
+    return qimage, full_size.width() / qimage.width()
+
+
+class ScaleTaskSignals(QObject):
+    """Signals for ScaleTask (QRunnable itself cannot emit)."""
+    scaled = pyqtSignal(QImage, int)  # scaled image, request id
+
+
+class ScaleTask(QRunnable):
+    """Resamples the crop source image with Pillow on the global thread pool."""
+
+    def __init__(self, source, size, request_id):
+        super().__init__()
+        self.source = source # QImage; implicitly shared, so this is not a pixel copy
+        self.size = size
+        self.request_id = request_id
+        self.signals = ScaleTaskSignals()
+
+    def run(self):
+        size = self.size
+        if self.source.isNull() or size.width() <= 0 or size.height() <= 0:
+            return
+        try:
+            # Wrap the QImage's pixels without copying them; qimage stays
+            # referenced until resize() has produced its own image
+            qimage = self.source.convertToFormat(QImage.Format_RGBA8888)
+            ptr = qimage.constBits()
+            ptr.setsize(qimage.byteCount())
+            source = Image.frombuffer(
+                'RGBA', (qimage.width(), qimage.height()), ptr,
+                'raw', 'RGBA', qimage.bytesPerLine(), 1
+            )
+            img = source.resize((size.width(), size.height()), Image.Resampling.LANCZOS)
+            data = img.tobytes() # Source is RGBA, so this is already raw RGBA
+            # copy() detaches the QImage from the temporary bytes buffer
+            qimage = QImage(data, img.width, img.height, img.width * 4, QImage.Format_RGBA8888).copy()
+            self.signals.scaled.emit(qimage, self.request_id)
+        except Exception as e:
+            print(f"Error scaling preview image: {e}")
+
+
+class ThumbnailLoaderSignals(QObject):
+    """Signals for ThumbnailLoader (QRunnable itself cannot emit)."""
+    done = pyqtSignal(str, QImage)  # cache key, thumbnail image (null on failure)
+
+
+class ThumbnailLoader(QRunnable):
+    """Decodes and downsamples one gallery thumbnail on the global thread pool."""
+
+    def __init__(self, image_path, cache_key, disk_cache_path=None):
+        super().__init__()
+        self.image_path = image_path
+        self.cache_key = cache_key or ""
+        self.disk_cache_path = disk_cache_path
+        self.signals = ThumbnailLoaderSignals()
+
+    def run(self):
+        # Only QImage is built here; QPixmap must be created on the GUI thread
+        if self.disk_cache_path and os.path.exists(self.disk_cache_path):
+            qimage = QImage(self.disk_cache_path)
+            if not qimage.isNull():
+                self.signals.done.emit(self.cache_key, qimage)
+                return
+
+        qimage, _ = read_scaled_image(self.image_path, QSize(CROPPER_THUMB_IMG_WIDTH, CROPPER_THUMB_IMG_HEIGHT))
+        if qimage.isNull():
+            qimage = self._load_with_pil()
+        if not qimage.isNull() and self.disk_cache_path:
+            self._write_disk_cache(qimage)
+        self.signals.done.emit(self.cache_key, qimage)
+
+    def _write_disk_cache(self, qimage):
+        """Store the thumbnail for the next session; written to a temp name, then renamed."""
+        tmp_path = f"{self.disk_cache_path}.{id(self)}.tmp"
+        ext = os.path.splitext(self.disk_cache_path)[1][1:].upper()
+        try:
+            if qimage.save(tmp_path, ext, THUMB_DISK_CACHE_QUALITY):
+                os.replace(tmp_path, self.disk_cache_path)
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except OSError as e:
+            print(f"Could not cache thumbnail for {self.image_path}: {e}")
+
+    def _load_with_pil(self) -> QImage:
+        """Fallback for formats Qt's image plugins cannot read (e.g. HEIC)."""
+        qimage = QImage()
+        try:
+            with Image.open(self.image_path) as img:
+                # Let libjpeg downscale first (1/2 to 1/8 DCT scaling) so LANCZOS
+                # only runs on a much smaller image; keep the file's own mode so
+                # the draft never changes colour handling
+                if img.format == 'JPEG':
+                    img.draft(img.mode, (CROPPER_THUMB_IMG_WIDTH * 2, CROPPER_THUMB_IMG_HEIGHT * 2))
+                img.thumbnail((CROPPER_THUMB_IMG_WIDTH, CROPPER_THUMB_IMG_HEIGHT), Image.Resampling.LANCZOS)
+
+                # Ensure image is in a mode that QImage can handle directly or convert it
+                if img.mode in ('P', 'LA'):  # Palette / Luminance Alpha
+                    img = img.convert('RGBA')
+                elif img.mode not in ('RGB', 'RGBA'):
+                    img = img.convert('RGB')  # Fallback to RGB for other modes
+
+                # tobytes() is already raw in the image's own mode. Keep the buffer
+                # referenced until copy() detaches the QImage from it; rows are
+                # tightly packed, so pass bytesPerLine instead of Qt's 32-bit default
+                buf = img.tobytes()
+                if img.mode == 'RGBA':
+                    qimage = QImage(buf, img.width, img.height, img.width * 4, QImage.Format_RGBA8888).copy()
+                else:
+                    qimage = QImage(buf, img.width, img.height, img.width * 3, QImage.Format_RGB888).copy()
+        except Exception as e:
+            print(f"Error creating thumbnail for {self.image_path}: {e}")
+            traceback.print_exc()
+        return qimage
+
+
+class CropSaveWorkerSignals(QObject):
+    """Signals for CropSaveWorker (QRunnable itself cannot emit)."""
+    finished = pyqtSignal(str)  # output path
+    failed = pyqtSignal(str)  # error message
+
+
+class CropSaveWorker(QRunnable):
+    """Flattens and encodes one cropped image on the global thread pool."""
+
+    def __init__(self, image, output_path, file_format, save_kwargs):
+        super().__init__()
+        self.image = image # Sole reference; released once the file is written
+        self.output_path = output_path
+        self.file_format = file_format
+        self.save_kwargs = save_kwargs
+        self.signals = CropSaveWorkerSignals()
+
+    def run(self):
+        image, self.image = self.image, None
+        try:
+            # JPEG has no alpha; crop_and_save has already normalised to RGB/RGBA
+            if self.file_format == 'jpeg' and image.mode == 'RGBA':
+                if image.getextrema()[3][0] == 255:
+                    # Fully opaque: dropping alpha is all the flattening needed
+                    image = image.convert('RGB')
+                else:
+                    # Blend onto white in one C pass, without split()ing out an alpha band
+                    background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+                    image = Image.alpha_composite(background, image).convert('RGB')
+
+            # Save the image through a 1 MiB write buffer so the encoder's
+            # output reaches the disk in large chunks
+            with open(self.output_path, 'wb', buffering=SAVE_BUFFER_SIZE) as fp:
+                image.save(fp, format=self.file_format.upper(), **self.save_kwargs)
+        except Exception as e:
+            print(f"Error saving {self.output_path}: {e}")
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.output_path)
+
 
 class CropArea(QLabel):
     """Custom widget for selecting crop area with mouse interaction."""
     crop_changed = pyqtSignal(QRect)
+
+    HANDLE_NAMES = (
+        'top_left', 'top_right', 'bottom_left', 'bottom_right',
+        'top_middle', 'bottom_middle', 'left_middle', 'right_middle'
+    )
+    # (corner, top/bottom middle, left/right middle) per [bottom_half][right_half]
+    QUADRANT_HANDLES = (
+        (('top_left', 'top_middle', 'left_middle'), ('top_right', 'top_middle', 'right_middle')),
+        (('bottom_left', 'bottom_middle', 'left_middle'), ('bottom_right', 'bottom_middle', 'right_middle')),
+    )
+    HANDLE_CURSORS = {
+        'top_left': Qt.SizeFDiagCursor, 'bottom_right': Qt.SizeFDiagCursor,
+        'top_right': Qt.SizeBDiagCursor, 'bottom_left': Qt.SizeBDiagCursor,
+        'top_middle': Qt.SizeVerCursor, 'bottom_middle': Qt.SizeVerCursor,
+        'left_middle': Qt.SizeHorCursor, 'right_middle': Qt.SizeHorCursor,
+    }
+
+    # Handle centre as a fraction of the selection extent, in HANDLE_NAMES order
+    HANDLE_OFFSETS = np.array([
+        [0, 0], [1, 0], [0, 1], [1, 1],
+        [0.5, 0], [0.5, 1], [0, 0.5], [1, 0.5],
+    ], dtype=np.float32)
+
+    # Clockwise screen rotation -> PIL transpose (PIL rotates counter-clockwise)
+    ROTATION_TRANSPOSE = {
+        90: Image.Transpose.ROTATE_270,
+        180: Image.Transpose.ROTATE_180,
+        270: Image.Transpose.ROTATE_90,
+    }
     
     def __init__(self, parent=None):
         # Set up the widget
         super().__init__(parent)
         self.setMinimumSize(400, 300)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setStyleSheet("""
-            CropArea {
-                background-color: #f8f9fa;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-            }
-            CropArea QToolButton {
-                background-color: #4f46e5;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                margin: 2px;
-            }
-            CropArea QToolButton:hover {
-                background-color: #4338ca;
-            }
-            CropArea QToolButton:pressed {
-                background-color: #3730a3;
-            }
-            CropArea QLabel {
-                color: #4b5563;
-                font-size: 12px;
-                margin: 4px 0;
-            }
-        """)
+        self.setObjectName("CropArea")  # Styled by the application theme stylesheet
         self.setMouseTracking(True)
         self.setAlignment(Qt.AlignCenter)
         self.setFocusPolicy(Qt.StrongFocus)  # Enable keyboard focus
         
-        # Image properties
-        self.original_pixmap = None
+        # Image properties. The full-resolution pixmap lives in QPixmapCache;
+        # see the original_pixmap property
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self._pixmap_key = None
+        self._pinned_pixmap = None # Used when there is no file to reload from
+        self._source_path = None
+        self._source_transform = QTransform() # Rotations applied to the pixels since load
+        self._rotation = 0 # Same rotation in degrees, for crop_source_image
+        self._source_scale = 1.0 # Source-file pixels per original_pixmap pixel (display decimation)
+        self._source_read_size = None # Size the pixmap was decoded at, for reloads
+        # Flips are display state only; see flip_horizontal_image/crop_source_image
+        self.flip_h = False
+        self.flip_v = False
         self.scaled_pixmap = None
         self.scale_factor = 1.0
-        
-        # Crop area properties
+        self._scale_x = self._scale_y = 0.0 # Widget-to-image scale, see _update_scale_cache
+        self._image_origin = (0, 0)
+        self._image_rect_cache = QRect() # See get_image_rect
+        self._crop_source_qimage = None # Backing buffer for get_crop_as_numpy
+        self._crop_source_array = None
+        
+        # Crop area properties; always update through _set_selection so the
+        # cached normalized rect stays in sync
         self.start_pos = QPoint()
         self.end_pos = QPoint()
+        self._sel_rect = QRect(self.start_pos, self.end_pos).normalized()
         self.is_drawing = False
         self.is_moving = False
         self.is_resizing = False
         self.resize_handle_being_dragged = None # Stores which handle, e.g., 'top_left', 'bottom_right'
         self.move_start_pos = QPoint() # For calculating drag offset
         self.original_selection_rect_on_drag_start = QRect() # Store selection rect when move/resize starts
+        self._handle_rects = {name: QRect() for name in self.HANDLE_NAMES} # Reused by get_handle_rects
+        self._handle_rects_key = None # (x, y, w, h, handle_size) the handle rects were built for
+        self._handle_rect_list = list(self._handle_rects.values()) # Same QRects, for drawRects
+        self._guide_lines = [] # Rule-of-thirds lines, see get_guide_lines
+        self._guide_lines_key = None
+        self._handle_origin_buf = np.zeros((len(self.HANDLE_NAMES), 2), dtype=np.int32)
+        self._handle_scaled_buf = np.zeros((len(self.HANDLE_NAMES), 2), dtype=np.float32)
         self.aspect_ratio = 0  # 0 means free form
         self.fixed_size = QSize(300, 300)  # Default fixed size
         self.min_size = 20  # Minimum crop size
@@ -109,6 +390,18 @@ class CropArea(QLabel):
         # Visual guides
         self.show_guides = True
         self.guide_style = 'grid'  # 'grid' or 'rule_of_thirds'
+
+        # Painting resources, built once instead of on every paintEvent
+        self._overlay_color = QColor(0, 0, 0, 128)
+        self._overlay_pm = None # Widget-sized overlay fill, see _overlay_pixmap
+        self._overlay_pm_key = None
+        self._overlay_strips = [QRect() for _ in range(4)] # top, bottom, left, right; reused per paint
+        self._flip_transform = QTransform() # Mirror used by paintEvent while flipped
+        self._border_pen = QPen(Qt.white, 1, Qt.SolidLine)
+        self._handle_brush = QBrush(Qt.white)
+        self._handle_pen = QPen(Qt.black)
+        self._guide_pen = QPen(QColor(255, 255, 255, 100), 1, Qt.DashLine)
+        self._placeholder_color = QColor("#e0e0e0")
         
         # Aspect ratio presets
         self.aspect_ratio_presets = [
@@ -124,6 +417,8 @@ class CropArea(QLabel):
         
         # Set cursor
         self.setCursor(Qt.CrossCursor)
+        self._last_cursor_shape = Qt.CrossCursor
+        self._last_hover_pos = None
         
         # Timer for continuous key press
         self.key_repeat_timer = QTimer(self)
@@ -131,15 +426,103 @@ class CropArea(QLabel):
         self.key_repeat_timer.timeout.connect(self.handle_key_repeat)
         self.active_keys = set()
         self.last_key_event = None
+
+        # Coalesce crop_changed emissions to at most one per frame (~60 Hz)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._emit_pending_crop)
+
+        # Smooth scaling runs on the global thread pool; a fast scale is shown meanwhile
+        self._scale_request_id = 0
+        self._scale_source = QImage() # Pixels handed to ScaleTask
+        self._scale_signals = None # Signals of the latest ScaleTask, kept alive until delivery
+
+        # While zooming interactively only fast scaling is done; the smooth
+        # pass is requested once input has been idle for 200 ms
+        self._interactive = False
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(200)
+        self._smooth_timer.timeout.connect(self._finalize_smooth)
+
+    @property
+    def original_pixmap(self):
+        """The full-resolution source pixmap, or None.
+
+        When the image came from a file, only a QPixmapCache key is held so
+        the cache's memory budget applies; an evicted pixmap is reloaded from
+        disk and the recorded rotations/flips are re-applied.
+        """
+        if self._pinned_pixmap is not None:
+            return self._pinned_pixmap
+        if self._pixmap_key is None:
+            return None
+        pixmap = QPixmapCache.find(self._pixmap_key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._reload_original_pixmap()
+        return pixmap
+
+    @original_pixmap.setter
+    def original_pixmap(self, pixmap):
+        if self._pixmap_key is not None:
+            QPixmapCache.remove(self._pixmap_key)
+        self._pixmap_key = None
+        self._pinned_pixmap = None
+        if pixmap is None or pixmap.isNull():
+            return
+        if self._source_path:
+            self._pixmap_key = QPixmapCache.insert(pixmap)
+            if self._pixmap_key.isValid():
+                return
+            self._pixmap_key = None # Larger than the cache budget
+        self._pinned_pixmap = pixmap
+
+    def _reload_original_pixmap(self):
+        """Reload an evicted source pixmap from disk and re-cache it."""
+        qimage, _ = read_scaled_image(self._source_path, self._source_read_size)
+        pixmap = QPixmap.fromImage(qimage)
+        if pixmap.isNull():
+            print(f"Failed to reload image from {self._source_path}")
+            return None
+        if not self._source_transform.isIdentity():
+            pixmap = pixmap.transformed(self._source_transform, Qt.SmoothTransformation)
+        self._pixmap_key = QPixmapCache.insert(pixmap)
+        return pixmap
+
+    def _set_original_pixmap(self, pixmap):
+        """Set the full-resolution pixmap and keep its pixels for smooth scaling."""
+        self.original_pixmap = pixmap
+        self.scaled_pixmap = None
+        self._image_rect_cache = QRect()
+        self._crop_source_qimage = None # Backing buffer for get_crop_as_numpy
+        self._crop_source_array = None
+        self._scale_request_id += 1  # Invalidate results for the previous source
+        self._scale_source = pixmap.toImage() if pixmap else QImage()
     
-    def set_pixmap(self, pixmap):
-        """Set the image to be cropped."""
+    def set_pixmap(self, pixmap, source_path=None, source_scale=1.0):
+        """Set the image to be cropped.
+
+        Args:
+            pixmap: The image to display, or None to clear.
+            source_path: File the pixmap was loaded from. When given, the
+                pixmap is held in QPixmapCache and reloaded from this file
+                if evicted.
+            source_scale: Source pixels per pixmap pixel when the pixmap was
+                decoded below full resolution; selection_rect() reports
+                full-resolution coordinates either way.
+        """
         # Reset all display-related properties
-        self.original_pixmap = pixmap
+        self._source_path = source_path if pixmap else None
+        self._source_scale = source_scale if pixmap else 1.0
+        self._source_read_size = pixmap.size() if pixmap else None
+        self._source_transform = QTransform()
+        self._rotation = 0
+        self.flip_h = self.flip_v = False
+        self._set_original_pixmap(pixmap)
         self.offset_x = 0
         self.offset_y = 0
-        self.start_pos = QPoint()
-        self.end_pos = QPoint()
+        self._set_selection(QPoint(), QPoint())
         
         if pixmap:
             # Calculate initial scale to fit the image in the available space
@@ -164,6 +547,12 @@ class CropArea(QLabel):
             self.reset_selection()
         self.update()
 
+    def _set_selection(self, start: QPoint, end: QPoint):
+        """Set the selection corners and refresh the cached normalized rect."""
+        self.start_pos = start
+        self.end_pos = end
+        self._sel_rect = QRect(start, end).normalized()
+
     def get_aspect_ratio_tuple(self):
         """Return the aspect ratio as (width, height) tuple."""
         if self.aspect_ratio > 0:
@@ -188,19 +577,25 @@ class CropArea(QLabel):
 
     def clear_pixmap(self):
         """Clear the current pixmap and reset the widget."""
-        self.original_pixmap = None
+        self._source_path = None
+        self._source_scale = 1.0
+        self._source_read_size = None
+        self._source_transform = QTransform()
+        self._rotation = 0
+        self.flip_h = self.flip_v = False
+        self._set_original_pixmap(None)
         self.scaled_pixmap = None
         self.scale_factor = 1.0
         self.offset_x = 0
         self.offset_y = 0
-        self.start_pos = QPoint()
-        self.end_pos = QPoint()
+        self._set_selection(QPoint(), QPoint())
         self.update()
     
     def update_scaled_pixmap(self):
         """Update the scaled pixmap when the widget is resized or image changes."""
         if not self.original_pixmap:
             self.scaled_pixmap = None # Ensure scaled_pixmap is None if original is None
+            self._update_scale_cache()
             self.update()
             return
         
@@ -213,6 +608,7 @@ class CropArea(QLabel):
             # If available space is invalid, create a minimal or empty pixmap
             self.scaled_pixmap = QPixmap(1, 1) 
             self.scaled_pixmap.fill(Qt.transparent)
+            self._update_scale_cache()
             self.update()
             return
         
@@ -222,15 +618,61 @@ class CropArea(QLabel):
         scaled_size = self.original_pixmap.size()
         scaled_size.scale(available_size, Qt.KeepAspectRatio)
         
-        # Scale the pixmap
-        self.scaled_pixmap = self.original_pixmap.scaled(
-            scaled_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        self._scale_request_id += 1
+        if scaled_size == self.original_pixmap.size():
+            self.scaled_pixmap = self.original_pixmap
+        else:
+            # Show a cheap scale right away so geometry is correct, then ask
+            # the worker for the LANCZOS version (deferred while zooming)
+            if not self.scaled_pixmap or self.scaled_pixmap.size() != scaled_size:
+                self.scaled_pixmap = self.original_pixmap.scaled(
+                    scaled_size,
+                    Qt.KeepAspectRatio,
+                    Qt.FastTransformation
+                )
+            if not self._interactive:
+                task = ScaleTask(self._scale_source, scaled_size, self._scale_request_id)
+                self._scale_signals = task.signals
+                task.signals.scaled.connect(self._on_scaled_image)
+                QThreadPool.globalInstance().start(task)
         
+        self._update_scale_cache()
         # Update the display
         self.update()
+
+    def _begin_interactive(self):
+        """Use fast scaling until input has been idle for a short while."""
+        self._interactive = True
+        self._smooth_timer.start() # Restarts the idle countdown
+
+    def _finalize_smooth(self):
+        """Leave interactive mode and request the smooth-scaled pixmap."""
+        self._interactive = False
+        self.update_scaled_pixmap()
+
+    def _update_scale_cache(self):
+        """Cache the image rect plus the scale and origin used by selection_rect().
+
+        These only change when the scaled pixmap is rebuilt, so they are
+        computed here instead of on every selection query.
+        """
+        self._image_rect_cache = self._compute_image_rect() if self.scaled_pixmap else QRect()
+        img_rect = self._image_rect_cache
+        if not self.original_pixmap or img_rect.width() <= 0 or img_rect.height() <= 0:
+            self._scale_x = self._scale_y = 0.0
+            self._image_origin = (0, 0)
+            return
+        self._scale_x = self.original_pixmap.width() * self._source_scale / img_rect.width()
+        self._scale_y = self.original_pixmap.height() * self._source_scale / img_rect.height()
+        self._image_origin = (img_rect.x(), img_rect.y())
+
+    @pyqtSlot(QImage, int)
+    def _on_scaled_image(self, qimage, request_id):
+        """Swap in the smooth-scaled pixmap produced by ScaleTask."""
+        if request_id != self._scale_request_id or not self.original_pixmap:
+            return  # Stale result for an older size or source
+        self.scaled_pixmap = QPixmap.fromImage(qimage)
+        self.update()
         
     def set_aspect_ratio(self, width: int, height: int, keep_current_center=False):
         """Set the aspect ratio for the crop selection."""
@@ -247,158 +689,176 @@ class CropArea(QLabel):
             self.reset_selection()
             return
         
-        # Calculate dimensions based on aspect ratio, fitting within the image_rect
-        if self.aspect_ratio > 0:
-            if img_rect.width() / self.aspect_ratio <= img_rect.height():
-                crop_width = img_rect.width() * 0.8  # Default to 80% of image width
-                crop_height = crop_width / self.aspect_ratio
-            else:
-                crop_height = img_rect.height() * 0.8 # Default to 80% of image height
-                crop_width = crop_height * self.aspect_ratio
-        else: # Free form, default to 80% of the smaller dimension of the image_rect
-            side = min(img_rect.width(), img_rect.height()) * 0.8
-            crop_width = side
-            crop_height = side
-        
-        # print(f"[set_aspect_ratio] Calculated crop_width: {crop_width:.2f}, crop_height: {crop_height:.2f}")
-
-        # Center the new crop box within the image_rect
-        center_x = img_rect.left() + img_rect.width() / 2
-        center_y = img_rect.top() + img_rect.height() / 2
-        # print(f"[set_aspect_ratio] Image Center: ({center_x:.2f}, {center_y:.2f})")
-
-        half_crop_width = crop_width / 2
-        half_crop_height = crop_height / 2
-        # print(f"[set_aspect_ratio] Half Crop Dims: ({half_crop_width:.2f}, {half_crop_height:.2f})")
-
-        start_x = center_x - half_crop_width
-        start_y = center_y - half_crop_height
-        end_x = center_x + half_crop_width
-        end_y = center_y + half_crop_height
-        # print(f"[set_aspect_ratio] Raw start_pos: ({start_x:.2f}, {start_y:.2f}), Raw end_pos: ({end_x:.2f}, {end_y:.2f})")
-
-        # Ensure the crop box is within the image_rect boundaries
-        # This logic might need refinement if we want to allow parts of crop box outside image initially
-        start_x = max(img_rect.left(), start_x)
-        start_y = max(img_rect.top(), start_y)
-        end_x = min(img_rect.right(), end_x)
-        end_y = min(img_rect.bottom(), end_y)
-
-        # Ensure minimum size
-        if crop_width < self.min_size:
-            crop_width = self.min_size
-        if crop_height < self.min_size:
-            crop_height = self.min_size
-        
-        # print(f"[set_aspect_ratio] Final crop_width: {crop_width}x{crop_height} (after min_size check)")
-
-        # Update start_pos and end_pos
-        self.start_pos = QPoint(int(start_x), int(start_y))
-        self.end_pos = QPoint(int(start_x + crop_width), int(start_y + crop_height))
-        # print(f"[set_aspect_ratio] Final start_pos: {self.start_pos}, Final end_pos: {self.end_pos}")
-
-        self.crop_changed.emit(QRect(self.start_pos, self.end_pos).normalized())
+        # Size and centre the crop box within the image_rect (see _compute_crop_box)
+        start_x, start_y, end_x, end_y = _compute_crop_box(
+            img_rect.left(), img_rect.top(), img_rect.width(), img_rect.height(),
+            float(self.aspect_ratio), float(self.min_size)
+        )
+        self._set_selection(QPoint(start_x, start_y), QPoint(end_x, end_y))
+
+        self.crop_changed.emit(QRect(self._sel_rect))
         self.update() # Ensure the widget repaints to show the new/updated crop box
     
     def get_image_rect(self) -> QRect:
-        """Calculate the rectangle where the scaled image is actually drawn within the widget."""
+        """Return the rectangle where the scaled image is actually drawn within the widget.
+
+        The rect is cached by update_scaled_pixmap(); callers must not modify it.
+        """
         if not self.scaled_pixmap:
             return QRect(0, 0, self.width(), self.height()) # Return widget rect if no image
+        return self._image_rect_cache
 
+    def _compute_image_rect(self) -> QRect:
+        """Calculate the centred rectangle of the scaled pixmap within the widget."""
         widget_w, widget_h = self.width(), self.height()
         scaled_w, scaled_h = self.scaled_pixmap.width(), self.scaled_pixmap.height()
 
         offset_x = (widget_w - scaled_w) // 2
         offset_y = (widget_h - scaled_h) // 2
         
-        # print(f"[get_image_rect] Widget: {self.width()}x{self.height()}, ScaledPixmap: {scaled_w}x{scaled_h}, Offset: ({offset_x}, {offset_y})")
         return QRect(offset_x, offset_y, scaled_w, scaled_h)
 
-    def paintEvent(self, event):
-        """Handle paint events."""
-        super().paintEvent(event) 
-        painter = QPainter(self) # Initialize painter here
-
-        if not self.scaled_pixmap:
-            painter.fillRect(self.rect(), QColor("#e0e0e0"))
-            painter.setPen(Qt.black)
-            painter.drawText(self.rect(), Qt.AlignCenter, "No image loaded")
-            painter.end() # End painter if no image
-            return
-        
-        img_rect = self.get_image_rect()
-        # print(f"[paintEvent] Widget: {self.width()}x{self.height()}, ScaledPixmap: {self.scaled_pixmap.width()}x{self.scaled_pixmap.height()}, Image draw offset: ({img_rect.x()}, {img_rect.y()})")
-        painter.drawPixmap(img_rect.topLeft(), self.scaled_pixmap)
-        
-        if not self.start_pos.isNull() and not self.end_pos.isNull():
-            sel_rect = QRect(self.start_pos, self.end_pos).normalized()
-            # print(f"[paintEvent] Drawing crop box from {self.start_pos} to {self.end_pos}, Normalized: {sel_rect}")
-            
-            # Draw semi-transparent overlay outside selection
-            overlay_path = QPainterPath()
-            overlay_path.setFillRule(Qt.OddEvenFill) # Ensures the inner rect creates a hole
-            overlay_path.addRect(QRectF(self.rect())) # Covers the whole widget
-            overlay_path.addRect(QRectF(sel_rect)) # This creates a hole for the selection
-            painter.fillPath(overlay_path, QColor(0, 0, 0, 128)) # Semi-transparent black
-            
-            # Draw the selection rectangle border
-            pen = QPen(Qt.white, 1, Qt.SolidLine) # Changed to solid for now, easier to see
-            painter.setPen(pen)
-            painter.drawRect(sel_rect)
-            
-            # Draw resize handles
-            handle_size = 8
-            if sel_rect.width() > handle_size * 2 and sel_rect.height() > handle_size * 2:
-                painter.setBrush(Qt.white)
-                painter.setPen(Qt.black) # Border for handles
-                handle_visual_rects = self.get_handle_rects(sel_rect, handle_size)
-                for r in handle_visual_rects.values():
-                    painter.drawRect(r)
-            
-            # Draw guides if enabled (placeholder for now)
-            if self.show_guides:
-                pen.setStyle(Qt.DashLine)
-                pen.setColor(QColor(255,255,255,100))
-                painter.setPen(pen)
-                # Basic rule of thirds example
-                third_w = sel_rect.width() / 3.0
-                third_h = sel_rect.height() / 3.0
-                painter.drawLine(int(sel_rect.left() + third_w), sel_rect.top(), int(sel_rect.left() + third_w), sel_rect.bottom())
-                painter.drawLine(int(sel_rect.left() + 2 * third_w), sel_rect.top(), int(sel_rect.left() + 2 * third_w), sel_rect.bottom())
-                painter.drawLine(sel_rect.left(), int(sel_rect.top() + third_h), sel_rect.right(), int(sel_rect.top() + third_h))
-                painter.drawLine(sel_rect.left(), int(sel_rect.top() + 2 * third_h), sel_rect.right(), int(sel_rect.top() + 2 * third_h))
-
-        painter.end() # Moved to the very end
-
     def selection_rect(self):
         """Return the current selection rectangle in image coordinates."""
         if self.start_pos.isNull() or self.end_pos.isNull() or not self.original_pixmap:
             return QRect()
             
-        img_rect = self.get_image_rect()
-        if img_rect.isNull() or img_rect.width() == 0 or img_rect.height() == 0:
+        scale_x, scale_y = self._scale_x, self._scale_y
+        if not scale_x or not scale_y:
             return QRect()
-            
-        scale_x = self.original_pixmap.width() / img_rect.width()
-        scale_y = self.original_pixmap.height() / img_rect.height()
+        origin_x, origin_y = self._image_origin
+        sx, sy = self.start_pos.x(), self.start_pos.y()
+        ex, ey = self.end_pos.x(), self.end_pos.y()
         
-        x1 = round((min(self.start_pos.x(), self.end_pos.x()) - img_rect.x()) * scale_x)
-        y1 = round((min(self.start_pos.y(), self.end_pos.y()) - img_rect.y()) * scale_y)
-        x2 = round((max(self.start_pos.x(), self.end_pos.x()) - img_rect.x()) * scale_x)
-        y2 = round((max(self.start_pos.y(), self.end_pos.y()) - img_rect.y()) * scale_y)
+        x1 = int(((sx if sx < ex else ex) - origin_x) * scale_x + 0.5)
+        y1 = int(((sy if sy < ey else ey) - origin_y) * scale_y + 0.5)
+        x2 = int(((ex if sx < ex else sx) - origin_x) * scale_x + 0.5)
+        y2 = int(((ey if sy < ey else sy) - origin_y) * scale_y + 0.5)
         
         width = max(1, x2 - x1)
         height = max(1, y2 - y1)
+
+        # Map from the (possibly mirrored) view back to the stored pixmap
+        if self.flip_h or self.flip_v:
+            size = self.original_pixmap.size()
+            if self.flip_h:
+                x1 = int(size.width() * self._source_scale + 0.5) - x1 - width
+            if self.flip_v:
+                y1 = int(size.height() * self._source_scale + 0.5) - y1 - height
         
         return QRect(x1, y1, width, height)
 
+    def get_crop_as_numpy(self) -> Optional[np.ndarray]:
+        """Return the current selection of the original image as an RGBA numpy view.
+
+        The full image buffer is wrapped once per source pixmap and the
+        selection is returned as a slice of it, so no pixel data is copied.
+        The view is only valid until the source image changes; copy it if
+        it needs to outlive that.
+        """
+        if not self.original_pixmap:
+            return None
+        rect = self.selection_rect()
+        if rect.isNull():
+            return None
+        if self._source_scale != 1.0:
+            # selection_rect() is in source-file pixels; index the decimated buffer
+            s = self._source_scale
+            rect = QRect(int(rect.x() / s), int(rect.y() / s),
+                         max(1, int(rect.width() / s)), max(1, int(rect.height() / s)))
+
+        if self._crop_source_array is None:
+            qimage = self.original_pixmap.toImage().convertToFormat(QImage.Format_RGBA8888)
+            height, width = qimage.height(), qimage.width()
+            ptr = qimage.constBits()
+            ptr.setsize(height * qimage.bytesPerLine())
+            arr = np.frombuffer(ptr, dtype=np.uint8).reshape(height, qimage.bytesPerLine())
+            # Keep the QImage alive for as long as the array views its buffer
+            self._crop_source_qimage = qimage
+            self._crop_source_array = arr[:, :width * 4].reshape(height, width, 4)
+
+        arr = self._crop_source_array
+        x1 = max(0, rect.left())
+        y1 = max(0, rect.top())
+        x2 = min(arr.shape[1], rect.left() + rect.width())
+        y2 = min(arr.shape[0], rect.top() + rect.height())
+        crop = arr[y1:y2, x1:x2]
+        # Negative strides keep the mirrored view zero-copy
+        if self.flip_h:
+            crop = crop[:, ::-1]
+        if self.flip_v:
+            crop = crop[::-1]
+        return crop
+
+    def source_pixmap(self):
+        """Return original_pixmap as crop_source_image() expects its source.
+
+        The accumulated rotation is undone; flips are never applied to the
+        pixmap. Returns None when the pixmap cannot stand in for the source,
+        i.e. when it was decoded below full resolution.
+        """
+        pixmap = self.original_pixmap
+        if not pixmap or self._source_scale != 1.0:
+            return None
+        if self._source_transform.isIdentity():
+            return pixmap
+        inverse, invertible = self._source_transform.inverted()
+        if not invertible:
+            return None
+        return pixmap.transformed(inverse, Qt.SmoothTransformation)
+
+    def crop_source_image(self, pil_image):
+        """Crop the unrotated, unflipped source image to the selection as displayed.
+
+        The selection is mapped back through the accumulated rotation, the
+        source is cropped, and the rotation and flips are applied to the
+        cropped region only. Returns None if the selection is empty.
+        """
+        rect = self.selection_rect()
+        if rect.isNull() or pil_image is None:
+            return None
+
+        if not self._source_transform.isIdentity():
+            matrix = QPixmap.trueMatrix(self._source_transform, pil_image.width, pil_image.height)
+            inverse, invertible = matrix.inverted()
+            if not invertible:
+                return None
+            rect = inverse.mapRect(QRectF(rect)).toAlignedRect()
+
+        left = max(0, rect.left())
+        upper = max(0, rect.top())
+        right = min(pil_image.width, rect.left() + rect.width())
+        lower = min(pil_image.height, rect.top() + rect.height())
+        if left >= right or upper >= lower:
+            return None
+
+        cropped = pil_image.crop((left, upper, right, lower))
+        if self._rotation in self.ROTATION_TRANSPOSE:
+            cropped = cropped.transpose(self.ROTATION_TRANSPOSE[self._rotation])
+        elif self._rotation:
+            cropped = cropped.rotate(-self._rotation, expand=True)
+        if self.flip_h:
+            cropped = cropped.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+        if self.flip_v:
+            cropped = cropped.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+        return cropped
+
     def reset_selection(self):
         """Reset the selection area."""
-        self.start_pos = QPoint()
-        self.end_pos = QPoint()
+        self._set_selection(QPoint(), QPoint())
+        self._emit_timer.stop()  # Drop any pending emission for the old selection
         self.update()
         self.crop_changed.emit(QRect())
 
+    def schedule_crop_changed(self):
+        """Queue a crop_changed emission, coalescing bursts into one per frame."""
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _emit_pending_crop(self):
+        """Emit crop_changed with the selection as it stands when the timer fires."""
+        self.crop_changed.emit(self.selection_rect())
+
     def keyPressEvent(self, event):
         """Handle key press events for keyboard shortcuts."""
         key = event.key()
@@ -413,8 +873,10 @@ class CropArea(QLabel):
             if parent_widget and hasattr(parent_widget, 'crop_and_save_action'):
                 parent_widget.crop_and_save_action()
         elif key == Qt.Key_Plus or key == Qt.Key_Equal:
+            self._begin_interactive()
             self.adjust_zoom(1.1)
         elif key == Qt.Key_Minus or key == Qt.Key_Underscore:
+            self._begin_interactive()
             self.adjust_zoom(0.9)
         
         if not self.key_repeat_timer.isActive() and self.active_keys:
@@ -434,41 +896,45 @@ class CropArea(QLabel):
         if not self.active_keys or not self.last_key_event:
             return
             
-        move_step = 5
-        resize_step = 2
+        resizing = Qt.Key_Shift in self.active_keys # Shift turns arrow keys into resize
+        step = 2 if resizing else 5
         
-        # Create a copy of active_keys for safe iteration if modification occurs
-        for key in list(self.active_keys):
+        # Sum all held arrow keys into one delta so diagonals cost a single update
+        dx = dy = 0
+        for key in self.active_keys:
             if key == Qt.Key_Left:
-                if Qt.Key_Shift in self.active_keys:
-                    self.resize_crop_area(-resize_step, 0)    
-                else:
-                    self.move_crop_area(-move_step, 0)
+                dx -= step
             elif key == Qt.Key_Right:
-                if Qt.Key_Shift in self.active_keys:
-                    self.resize_crop_area(resize_step, 0)
-                else:
-                    self.move_crop_area(move_step, 0)
+                dx += step
             elif key == Qt.Key_Up:
-                if Qt.Key_Shift in self.active_keys:
-                    self.resize_crop_area(0, -resize_step)
-                else:
-                    self.move_crop_area(0, -move_step)
+                dy -= step
             elif key == Qt.Key_Down:
-                if Qt.Key_Shift in self.active_keys:
-                    self.resize_crop_area(0, resize_step)
-                else:
-                    self.move_crop_area(0, move_step)
-            # Shift key alone doesn't do anything, it modifies arrow keys
+                dy += step
+        
+        apply = self.resize_crop_area if resizing else self.move_crop_area
+        # Diagonals are one update when the combined step fits. Otherwise each
+        # axis is applied on its own, so an edge blocking one direction does
+        # not stop the other; with an aspect ratio a combined resize would
+        # drop dh, so resizes then always go axis by axis
+        if dx and dy and not (resizing and self.aspect_ratio > 0) and apply(dx, dy):
+            return
+        if dx:
+            apply(dx, 0)
+        if dy:
+            apply(0, dy)
 
     def move_crop_area(self, dx, dy):
-        """Move the crop area by the specified delta in widget coordinates."""
+        """Move the crop area by the specified delta in widget coordinates.
+
+        Returns:
+            True if the selection moved, False if the move would leave the image.
+        """
         if self.start_pos.isNull() or self.end_pos.isNull():
-            return
+            return False
 
         img_rect = self.get_image_rect()
         if img_rect.isNull():
-            return
+            return False
 
         new_start_pos = self.start_pos + QPoint(dx, dy)
         new_end_pos = self.end_pos + QPoint(dx, dy)
@@ -482,46 +948,41 @@ class CropArea(QLabel):
             img_rect.contains(potential_sel_rect.bottomRight()) and
             img_rect.contains(potential_sel_rect.topRight()) and
             img_rect.contains(potential_sel_rect.bottomLeft())):
-            self.start_pos = new_start_pos
-            self.end_pos = new_end_pos
+            self._set_selection(new_start_pos, new_end_pos)
             self.update()
-            self.crop_changed.emit(self.selection_rect())
+            self.schedule_crop_changed()
+            return True
+        return False
 
     def resize_crop_area(self, dw, dh):
-        """Resize the crop area by the specified delta, maintaining aspect ratio if set."""
+        """Resize the crop area by the specified delta, maintaining aspect ratio if set.
+
+        Returns:
+            True if the selection changed, False if it would leave the image.
+        """
         if self.start_pos.isNull() or self.end_pos.isNull():
-            return
+            return False
 
         img_rect = self.get_image_rect()
         if img_rect.isNull():
-            return
-
-        current_rect = QRect(self.start_pos, self.end_pos).normalized()
-        new_width = current_rect.width() + dw
-        new_height = current_rect.height() + dh
-        
-        # Ensure minimum size
-        min_dim = 20 
-        new_width = max(min_dim, new_width)
-        new_height = max(min_dim, new_height)
+            return False
 
-        if self.aspect_ratio > 0:
-            if dw != 0: # Width changed primarily
-                new_height = new_width / self.aspect_ratio
-            elif dh != 0: # Height changed primarily
-                new_width = new_height * self.aspect_ratio
-        
         # Anchor is top-left for now, adjust end_pos
         # More sophisticated resizing would consider which handle is 'dragged'
-        new_end_x = self.start_pos.x() + new_width
-        new_end_y = self.start_pos.y() + new_height
-        
-        potential_new_end_pos = QPoint(int(round(new_end_x)), int(round(new_end_y)))
+        current_rect = self._sel_rect
+        new_end_x, new_end_y = _compute_resized_end(
+            self.start_pos.x(), self.start_pos.y(),
+            current_rect.width(), current_rect.height(),
+            dw, dh, float(self.aspect_ratio), 20.0
+        )
+        potential_new_end_pos = QPoint(new_end_x, new_end_y)
 
         if img_rect.contains(self.start_pos) and img_rect.contains(potential_new_end_pos):
-            self.end_pos = potential_new_end_pos
+            self._set_selection(self.start_pos, potential_new_end_pos)
             self.update()
-            self.crop_changed.emit(self.selection_rect())
+            self.schedule_crop_changed()
+            return True
+        return False
 
     def adjust_zoom(self, factor):
         """Adjust the zoom level of the image."""
@@ -539,31 +1000,81 @@ class CropArea(QLabel):
             else:
                 self.update() # General update if no aspect ratio set
 
-    def get_handle_rects(self, sel_rect: QRect, handle_size: int) -> dict:
-        """Calculate rectangles for all 8 resize handles."""
+    def _handle_origins(self, sel_rect: QRect, handle_size: int) -> np.ndarray:
+        """Return the top-left corner of every handle as an (8, 2) array, in HANDLE_NAMES order."""
         half_handle = handle_size // 2
-        handles = {}
-        handles['top_left'] = QRect(sel_rect.left() - half_handle, sel_rect.top() - half_handle, handle_size, handle_size)
-        handles['top_right'] = QRect(sel_rect.right() - half_handle, sel_rect.top() - half_handle, handle_size, handle_size)
-        handles['bottom_left'] = QRect(sel_rect.left() - half_handle, sel_rect.bottom() - half_handle, handle_size, handle_size)
-        handles['bottom_right'] = QRect(sel_rect.right() - half_handle, sel_rect.bottom() - half_handle, handle_size, handle_size)
-        handles['top_middle'] = QRect(sel_rect.center().x() - half_handle, sel_rect.top() - half_handle, handle_size, handle_size)
-        handles['bottom_middle'] = QRect(sel_rect.center().x() - half_handle, sel_rect.bottom() - half_handle, handle_size, handle_size)
-        handles['left_middle'] = QRect(sel_rect.left() - half_handle, sel_rect.center().y() - half_handle, handle_size, handle_size)
-        handles['right_middle'] = QRect(sel_rect.right() - half_handle, sel_rect.center().y() - half_handle, handle_size, handle_size)
-        return handles
+        # Handle centres are offsets (0, 0.5 or 1) along the inclusive extent;
+        # one multiply-add places all eight, then truncation floors them like
+        # QRect.center() does
+        scaled = self._handle_scaled_buf
+        np.multiply(self.HANDLE_OFFSETS, (sel_rect.width() - 1, sel_rect.height() - 1), out=scaled)
+        origins = self._handle_origin_buf
+        origins[:] = scaled
+        origins += (sel_rect.left() - half_handle, sel_rect.top() - half_handle)
+        return origins
+
+    def get_handle_rects(self, sel_rect: QRect, handle_size: int) -> dict:
+        """Calculate rectangles for all 8 resize handles.
+
+        The returned QRects are reused between calls and only recomputed when
+        the selection geometry or handle size changed since the last call.
+        """
+        key = (sel_rect.x(), sel_rect.y(), sel_rect.width(), sel_rect.height(), handle_size)
+        if key == self._handle_rects_key:
+            return self._handle_rects
+        origins = self._handle_origins(sel_rect, handle_size)
+        for (x, y), rect in zip(origins.tolist(), self._handle_rects.values()):
+            rect.setRect(x, y, handle_size, handle_size)
+        self._handle_rects_key = key
+        return self._handle_rects
+
+    def get_guide_lines(self, sel_rect: QRect) -> list:
+        """Return the four rule-of-thirds QLines for the selection.
+
+        Like get_handle_rects, the list is rebuilt only when the selection moved.
+        """
+        key = (sel_rect.x(), sel_rect.y(), sel_rect.width(), sel_rect.height())
+        if key != self._guide_lines_key:
+            left, top = sel_rect.left(), sel_rect.top()
+            right, bottom = sel_rect.right(), sel_rect.bottom()
+            width, height = sel_rect.width(), sel_rect.height()
+            x1, x2 = left + width // 3, left + 2 * width // 3
+            y1, y2 = top + height // 3, top + 2 * height // 3
+            self._guide_lines = [
+                QLine(x1, top, x1, bottom), QLine(x2, top, x2, bottom),
+                QLine(left, y1, right, y1), QLine(left, y2, right, y2),
+            ]
+            self._guide_lines_key = key
+        return self._guide_lines
 
     def determine_resize_handle(self, pos: QPoint) -> str:
         """Check if the mouse position is over any resize handle."""
         if self.start_pos.isNull() or self.end_pos.isNull():
             return None
-        sel_rect = QRect(self.start_pos, self.end_pos).normalized()
+        sel_rect = self._sel_rect
         handle_size = 10 # Make handle detection area slightly larger than visual
         
-        handles = self.get_handle_rects(sel_rect, handle_size)
-        for name, rect in handles.items():
-            if rect.contains(pos):
-                return name
+        half_handle = handle_size // 2
+        px, py = pos.x(), pos.y()
+        center = sel_rect.center()
+        cx, cy = center.x(), center.y()
+        
+        # Only the corner and the two edge handles of the pointer's quadrant can
+        # be hit, so test those directly, corner first
+        right_half = px >= cx
+        bottom_half = py >= cy
+        corner, horizontal_middle, vertical_middle = self.QUADRANT_HANDLES[bottom_half][right_half]
+        edge_x = sel_rect.right() if right_half else sel_rect.left()
+        edge_y = sel_rect.bottom() if bottom_half else sel_rect.top()
+        on_edge_x = 0 <= px - edge_x + half_handle < handle_size
+        on_edge_y = 0 <= py - edge_y + half_handle < handle_size
+        
+        if on_edge_x and on_edge_y:
+            return corner
+        if on_edge_y and 0 <= px - cx + half_handle < handle_size:
+            return horizontal_middle
+        if on_edge_x and 0 <= py - cy + half_handle < handle_size:
+            return vertical_middle
         return None
 
     def mousePressEvent(self, event: QMouseEvent):
@@ -577,7 +1088,7 @@ class CropArea(QLabel):
             return
 
         self.resize_handle_being_dragged = self.determine_resize_handle(event.pos())
-        current_selection_rect = QRect(self.start_pos, self.end_pos).normalized()
+        current_selection_rect = QRect(self._sel_rect) # Copy, kept as drag origin
 
         if self.resize_handle_being_dragged:
             self.is_resizing = True
@@ -589,44 +1100,43 @@ class CropArea(QLabel):
             self.original_selection_rect_on_drag_start = current_selection_rect
         else: # Start new selection
             self.is_drawing = True
-            self.start_pos = event.pos()
-            self.end_pos = event.pos()
+            self._set_selection(event.pos(), event.pos())
             # Ensure new selection starts within image bounds if logic requires it
             # For now, raw widget coordinates are fine, will be clamped or adjusted in move
         self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent):
         if not self.scaled_pixmap:
-            self.setCursor(Qt.ArrowCursor)
+            self._set_cursor_shape(Qt.ArrowCursor)
             return
 
         img_rect = self.get_image_rect()
         mouse_pos = event.pos()
 
         if not (self.is_drawing or self.is_moving or self.is_resizing):
+            if mouse_pos == self._last_hover_pos:
+                return # Redundant move event, cursor is already right
+            self._last_hover_pos = QPoint(mouse_pos)
             handle = self.determine_resize_handle(mouse_pos)
             if handle:
-                if handle in ['top_left', 'bottom_right']:
-                    self.setCursor(Qt.SizeFDiagCursor)
-                elif handle in ['top_right', 'bottom_left']:
-                    self.setCursor(Qt.SizeBDiagCursor)
-                elif handle in ['top_middle', 'bottom_middle']:
-                    self.setCursor(Qt.SizeVerCursor)
-                elif handle in ['left_middle', 'right_middle']:
-                    self.setCursor(Qt.SizeHorCursor)
-            elif QRect(self.start_pos, self.end_pos).normalized().contains(mouse_pos):
-                self.setCursor(Qt.SizeAllCursor)
+                self._set_cursor_shape(self.HANDLE_CURSORS[handle])
+            elif self._sel_rect.contains(mouse_pos):
+                self._set_cursor_shape(Qt.SizeAllCursor)
             else:
-                self.setCursor(Qt.CrossCursor if img_rect.contains(mouse_pos) else Qt.ArrowCursor)
+                self._set_cursor_shape(Qt.CrossCursor if img_rect.contains(mouse_pos) else Qt.ArrowCursor)
             return
 
         delta = mouse_pos - self.move_start_pos
 
         if self.is_drawing:
-            self.end_pos = mouse_pos
-            # Clamp self.end_pos to img_rect boundaries
-            self.end_pos.setX(max(img_rect.left(), min(self.end_pos.x(), img_rect.right())))
-            self.end_pos.setY(max(img_rect.top(), min(self.end_pos.y(), img_rect.bottom())))
+            # Clamp the mouse position to img_rect boundaries
+            ex, ey = mouse_pos.x(), mouse_pos.y()
+            left, right = img_rect.left(), img_rect.right()
+            top, bottom = img_rect.top(), img_rect.bottom()
+            self._set_selection(self.start_pos, QPoint(
+                left if ex < left else (right if ex > right else ex),
+                top if ey < top else (bottom if ey > bottom else ey)
+            ))
 
         elif self.is_moving:
             orig_rect = self.original_selection_rect_on_drag_start
@@ -640,8 +1150,10 @@ class CropArea(QLabel):
             new_top_left.setX(max(img_rect.left(), min(new_top_left.x(), img_rect.right() - new_rect_width)))
             new_top_left.setY(max(img_rect.top(), min(new_top_left.y(), img_rect.bottom() - new_rect_height)))
             
-            self.start_pos = new_top_left
-            self.end_pos = QPoint(new_top_left.x() + new_rect_width, new_top_left.y() + new_rect_height)
+            self._set_selection(
+                new_top_left,
+                QPoint(new_top_left.x() + new_rect_width, new_top_left.y() + new_rect_height)
+            )
 
         elif self.is_resizing:
             # Basic free-form resizing for now. Aspect ratio constraint will be added later.
@@ -675,8 +1187,7 @@ class CropArea(QLabel):
             if new_rect.width() < min_dim: new_rect.setWidth(min_dim)
             if new_rect.height() < min_dim: new_rect.setHeight(min_dim)
 
-            self.start_pos = new_rect.topLeft()
-            self.end_pos = new_rect.bottomRight()
+            self._set_selection(new_rect.topLeft(), new_rect.bottomRight())
             
             # TODO: Add aspect ratio constraint here if self.aspect_ratio > 0
             # self.constrain_selection_aspect_ratio_on_resize()
@@ -685,69 +1196,114 @@ class CropArea(QLabel):
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
-            if self.is_drawing or self.is_moving or self.is_resizing:
+            # Drags only repaint; listeners hear about the result once, here.
+            # A plain click on the selection or a handle changes nothing, so stay quiet.
+            moved = self.is_drawing or (
+                (self.is_moving or self.is_resizing)
+                and self._sel_rect != self.original_selection_rect_on_drag_start
+            )
+            if moved:
+                self._emit_timer.stop()
                 self.crop_changed.emit(self.selection_rect())
             
             self.is_drawing = False
             self.is_moving = False
             self.is_resizing = False
             self.resize_handle_being_dragged = None
-            self.setCursor(Qt.ArrowCursor) # Reset cursor
+            self._last_hover_pos = None # Selection changed, re-evaluate on next hover
+            self._set_cursor_shape(Qt.ArrowCursor) # Reset cursor
             self.update()
+
+    def _set_cursor_shape(self, shape):
+        """Set the widget cursor, skipping the platform call if it is unchanged."""
+        if shape != self._last_cursor_shape:
+            self.setCursor(shape)
+            self._last_cursor_shape = shape
     
+    def _overlay_pixmap(self) -> QPixmap:
+        """Return a widget-sized pixmap filled with the overlay colour.
+
+        Shared through QPixmapCache by size, so it is rebuilt only after a
+        resize and reused by every CropArea of the same size.
+        """
+        key = f"cropper_overlay_{self.width()}x{self.height()}"
+        if self._overlay_pm is not None and self._overlay_pm_key == key:
+            return self._overlay_pm
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(self.size())
+            pixmap.fill(Qt.transparent)
+            filler = QPainter(pixmap)
+            filler.setCompositionMode(QPainter.CompositionMode_Source)
+            filler.fillRect(pixmap.rect(), self._overlay_color)
+            filler.end()
+            QPixmapCache.insert(key, pixmap)
+        self._overlay_pm = pixmap
+        self._overlay_pm_key = key
+        return pixmap
+
     def paintEvent(self, event):
         """Handle paint events."""
         super().paintEvent(event) 
         painter = QPainter(self) # Initialize painter here
 
         if not self.scaled_pixmap:
-            painter.fillRect(self.rect(), QColor("#e0e0e0"))
-            painter.setPen(Qt.black)
+            painter.fillRect(self.rect(), self._placeholder_color)
+            painter.setPen(self._handle_pen)
             painter.drawText(self.rect(), Qt.AlignCenter, "No image loaded")
             painter.end() # End painter if no image
             return
         
         img_rect = self.get_image_rect()
         # print(f"[paintEvent] Widget: {self.width()}x{self.height()}, ScaledPixmap: {self.scaled_pixmap.width()}x{self.scaled_pixmap.height()}, Image draw offset: ({img_rect.x()}, {img_rect.y()})")
-        painter.drawPixmap(img_rect.topLeft(), self.scaled_pixmap)
+        if self.flip_h or self.flip_v:
+            # Mirror about the image rect instead of flipping the pixels
+            self._flip_transform.setMatrix(
+                -1 if self.flip_h else 1, 0, 0,
+                0, -1 if self.flip_v else 1, 0,
+                2 * img_rect.left() + img_rect.width() if self.flip_h else 0,
+                2 * img_rect.top() + img_rect.height() if self.flip_v else 0, 1
+            )
+            painter.setTransform(self._flip_transform)
+            painter.drawPixmap(img_rect.topLeft(), self.scaled_pixmap)
+            painter.resetTransform()
+        else:
+            painter.drawPixmap(img_rect.topLeft(), self.scaled_pixmap)
         
         if not self.start_pos.isNull() and not self.end_pos.isNull():
-            sel_rect = QRect(self.start_pos, self.end_pos).normalized()
+            sel_rect = self._sel_rect
             # print(f"[paintEvent] Drawing crop box from {self.start_pos} to {self.end_pos}, Normalized: {sel_rect}")
             
-            # Draw semi-transparent overlay outside selection
-            overlay_path = QPainterPath()
-            overlay_path.setFillRule(Qt.OddEvenFill) # Ensures the inner rect creates a hole
-            overlay_path.addRect(QRectF(self.rect())) # Covers the whole widget
-            overlay_path.addRect(QRectF(sel_rect)) # This creates a hole for the selection
-            painter.fillPath(overlay_path, QColor(0, 0, 0, 128)) # Semi-transparent black
+            # Draw semi-transparent overlay outside selection as four strips
+            # (top, bottom, left, right) copied from the prebuilt overlay pixmap
+            w = self.rect()
+            overlay = self._overlay_pixmap()
+            top, bottom, left, right = self._overlay_strips
+            top.setRect(w.left(), w.top(), w.width(), sel_rect.top() - w.top())
+            bottom.setRect(w.left(), sel_rect.bottom() + 1, w.width(), w.bottom() - sel_rect.bottom())
+            left.setRect(w.left(), sel_rect.top(), sel_rect.left() - w.left(), sel_rect.height())
+            right.setRect(sel_rect.right() + 1, sel_rect.top(), w.right() - sel_rect.right(), sel_rect.height())
+            for strip in self._overlay_strips:
+                if strip.isValid():
+                    painter.drawPixmap(strip, overlay, strip)
             
             # Draw the selection rectangle border
-            pen = QPen(Qt.white, 1, Qt.SolidLine) # Changed to solid for now, easier to see
-            painter.setPen(pen)
+            painter.setPen(self._border_pen) # Solid white, easier to see
             painter.drawRect(sel_rect)
             
             # Draw resize handles
             handle_size = 8
             if sel_rect.width() > handle_size * 2 and sel_rect.height() > handle_size * 2:
-                painter.setBrush(Qt.white)
-                painter.setPen(Qt.black) # Border for handles
-                handle_visual_rects = self.get_handle_rects(sel_rect, handle_size)
-                for r in handle_visual_rects.values():
-                    painter.drawRect(r)
+                painter.setBrush(self._handle_brush)
+                painter.setPen(self._handle_pen) # Border for handles
+                self.get_handle_rects(sel_rect, handle_size) # Updates _handle_rect_list in place
+                painter.drawRects(self._handle_rect_list)
             
             # Draw guides if enabled (placeholder for now)
             if self.show_guides:
-                pen.setStyle(Qt.DashLine)
-                pen.setColor(QColor(255,255,255,100))
-                painter.setPen(pen)
-                # Basic rule of thirds example
-                third_w = sel_rect.width() / 3.0
-                third_h = sel_rect.height() / 3.0
-                painter.drawLine(int(sel_rect.left() + third_w), sel_rect.top(), int(sel_rect.left() + third_w), sel_rect.bottom())
-                painter.drawLine(int(sel_rect.left() + 2 * third_w), sel_rect.top(), int(sel_rect.left() + 2 * third_w), sel_rect.bottom())
-                painter.drawLine(sel_rect.left(), int(sel_rect.top() + third_h), sel_rect.right(), int(sel_rect.top() + third_h))
-                painter.drawLine(sel_rect.left(), int(sel_rect.top() + 2 * third_h), sel_rect.right(), int(sel_rect.top() + 2 * third_h))
+                painter.setPen(self._guide_pen)
+                # Basic rule of thirds example, batched into one drawLines call
+                painter.drawLines(self.get_guide_lines(sel_rect))
 
         painter.end() # Moved to the very end
 
@@ -760,11 +1316,17 @@ class CropArea(QLabel):
         current_ar = self.aspect_ratio
         ar_tuple = self.get_aspect_ratio_tuple()
         
-        # Rotate the image
+        # Rotate the image. The pixmap is stored unflipped, and rotating a
+        # mirrored view by +angle equals rotating the source by -angle
+        if self.flip_h != self.flip_v:
+            angle = -angle
         transform = QTransform().rotate(angle)
-        self.original_pixmap = self.original_pixmap.transformed(transform, Qt.SmoothTransformation)
+        self._source_transform *= transform
+        self._rotation = (self._rotation + angle) % 360
+        self._set_original_pixmap(self.original_pixmap.transformed(transform, Qt.SmoothTransformation))
         
         # Update the scaled pixmap and reset selection
+        self._begin_interactive() # Coalesce the smooth rescale across rapid clicks
         self.update_scaled_pixmap()
         
         # Re-apply aspect ratio if one was set
@@ -778,79 +1340,65 @@ class CropArea(QLabel):
             
         self.update()
         self.crop_changed.emit(self.selection_rect())
-        
-        # Notify parent to update the PIL image
-        if hasattr(self.parent(), '_update_pil_image_safely'):
-            self.parent()._update_pil_image_safely()
 
     def flip_horizontal_image(self):
-        """Flip the original_pixmap horizontally."""
+        """Flip the displayed image horizontally.
+
+        Only the flip state changes; the pixels are mirrored at paint time and
+        on the cropped region in crop_source_image().
+        """
         if not self.original_pixmap:
             return
             
-        # Store current selection
-        current_sel = self.selection_rect()
-        
-        # Flip the image
-        qimage = self.original_pixmap.toImage()
-        flipped_qimage = qimage.mirrored(True, False)
-        self.original_pixmap = QPixmap.fromImage(flipped_qimage)
+        # Store current selection (widget coordinates)
+        current_sel = QRect(self._sel_rect)
         
-        # Update display and selection
-        self.update_scaled_pixmap()
+        self.flip_h = not self.flip_h
         self.update()
         
         # Maintain the same selection area (flipped)
-        if not current_sel.isNull():
+        if not self.start_pos.isNull() and not self.end_pos.isNull():
             img_rect = self.get_image_rect()
-            new_x = img_rect.right() - current_sel.right() + img_rect.left()
-            self.start_pos = QPoint(new_x, current_sel.top())
-            self.end_pos = QPoint(new_x + current_sel.width(), current_sel.bottom())
+            new_x = img_rect.left() + img_rect.right() - current_sel.right()
+            self._set_selection(QPoint(new_x, current_sel.top()), QPoint(new_x + current_sel.width() - 1, current_sel.bottom()))
         
         self.crop_changed.emit(self.selection_rect())
-        
-        # Notify parent to update the PIL image
-        if hasattr(self.parent(), '_update_pil_image_safely'):
-            self.parent()._update_pil_image_safely()
 
     def flip_vertical_image(self):
-        """Flip the original_pixmap vertically."""
+        """Flip the displayed image vertically.
+
+        Only the flip state changes; the pixels are mirrored at paint time and
+        on the cropped region in crop_source_image().
+        """
         if not self.original_pixmap:
             return
             
-        # Store current selection
-        current_sel = self.selection_rect()
-        
-        # Flip the image
-        qimage = self.original_pixmap.toImage()
-        flipped_qimage = qimage.mirrored(False, True)
-        self.original_pixmap = QPixmap.fromImage(flipped_qimage)
+        # Store current selection (widget coordinates)
+        current_sel = QRect(self._sel_rect)
         
-        # Update display and selection
-        self.update_scaled_pixmap()
+        self.flip_v = not self.flip_v
         self.update()
         
         # Maintain the same selection area (flipped)
-        if not current_sel.isNull():
+        if not self.start_pos.isNull() and not self.end_pos.isNull():
             img_rect = self.get_image_rect()
-            new_y = img_rect.bottom() - current_sel.bottom() + img_rect.top()
-            self.start_pos = QPoint(current_sel.left(), new_y)
-            self.end_pos = QPoint(current_sel.right(), new_y + current_sel.height())
+            new_y = img_rect.top() + img_rect.bottom() - current_sel.bottom()
+            self._set_selection(QPoint(current_sel.left(), new_y), QPoint(current_sel.right(), new_y + current_sel.height() - 1))
         
         self.crop_changed.emit(self.selection_rect())
-        
-        # Notify parent to update the PIL image
-        if hasattr(self.parent(), '_update_pil_image_safely'):
-            self.parent()._update_pil_image_safely()
 
 class CropperThumbnailItem(QWidget):
     """Custom widget for displaying a single thumbnail in the CropperTool gallery."""
     clicked = pyqtSignal(str)  # Emits image path when clicked
 
-    def __init__(self, image_path, parent=None):
+    def __init__(self, image_path, parent=None, lazy=False):
+        """Create the item; with lazy=True the thumbnail waits for ensure_thumbnail()."""
         super().__init__(parent)
         self.image_path = image_path
         self.is_selected = False
+        self._thumb_requested = False
+        self._thumb_cache_key = None
+        self._thumb_loader_signals = None
 
         self.setFixedSize(CROPPER_THUMB_ITEM_WIDTH, CROPPER_THUMB_ITEM_HEIGHT)
         self.setStyleSheet("""
@@ -886,57 +1434,70 @@ class CropperThumbnailItem(QWidget):
         self.image_label.setText("...") # Placeholder while loading
         item_layout.addWidget(self.image_label, 0, Qt.AlignCenter)
 
-        self.name_label = QLabel(os.path.basename(image_path))
+        # Elide the filename to one line once, instead of word-wrapping it on every layout
+        file_name = os.path.basename(image_path)
+        self.name_label = QLabel()
         self.name_label.setObjectName("nameLabel")
+        self.name_label.setText(self.name_label.fontMetrics().elidedText(
+            file_name, Qt.ElideMiddle, CROPPER_THUMB_ITEM_WIDTH - 10
+        ))
+        self.name_label.setToolTip(file_name)
         self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setWordWrap(True)
-        # Ensure name_label can expand horizontally but has limited height
-        self.name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.name_label.setMaximumHeight(self.fontMetrics().height() * 2 + 4) # Max 2 lines
+        self.name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         item_layout.addWidget(self.name_label)
         
         item_layout.addStretch(1) # Pushes content up if there's extra space
 
         self.setLayout(item_layout)
-        self.set_thumbnail_pixmap()
+        if not lazy:
+            self.ensure_thumbnail()
 
-    def set_thumbnail_pixmap(self):
+    def ensure_thumbnail(self):
+        """Start loading the thumbnail the first time the item needs it."""
+        if not self._thumb_requested:
+            self._thumb_requested = True
+            self.set_thumbnail_pixmap()
+
+    def _thumbnail_cache_key(self) -> Optional[str]:
+        """QPixmapCache key for this thumbnail; includes mtime so edited files re-render."""
         try:
-            img = Image.open(self.image_path)
-            img.thumbnail((CROPPER_THUMB_IMG_WIDTH, CROPPER_THUMB_IMG_HEIGHT), Image.Resampling.LANCZOS)
-            
-            # Convert PIL Image to QPixmap safely
-            # Ensure image is in a mode that QImage can handle directly or convert it
-            if img.mode == 'P': # Palette mode, often needs conversion
-                img = img.convert('RGBA')
-            elif img.mode == 'LA': # Luminance Alpha
-                 img = img.convert('RGBA')
-            elif img.mode not in ['RGB', 'RGBA']:
-                img = img.convert('RGB') # Fallback to RGB for other modes
-
-            if img.mode == 'RGBA':
-                q_image = QImage(img.tobytes("raw", "RGBA"), img.width, img.height, QImage.Format_RGBA8888)
-            elif img.mode == 'RGB':
-                q_image = QImage(img.tobytes("raw", "RGB"), img.width, img.height, QImage.Format_RGB888)
-            else: # Should not happen due to conversions above
-                print(f"Unsupported image mode {img.mode} for {self.image_path}")
-                self.image_label.setText("Error")
-                return
+            mtime = os.path.getmtime(self.image_path)
+        except OSError:
+            return None
+        return f"cropthumb:{self.image_path}:{mtime}:{CROPPER_THUMB_IMG_WIDTH}x{CROPPER_THUMB_IMG_HEIGHT}"
 
-            if q_image.isNull():
-                print(f"Failed to create QImage for {self.image_path}")
-                self.image_label.setText("Error")
+    def set_thumbnail_pixmap(self):
+        # Reuse the rendered thumbnail when the same file was shown before
+        self._thumb_cache_key = self._thumbnail_cache_key()
+        if self._thumb_cache_key is not None:
+            cached = QPixmapCache.find(self._thumb_cache_key)
+            if cached is not None and not cached.isNull():
+                self.image_label.setPixmap(cached)
                 return
 
-            pixmap = QPixmap.fromImage(q_image)
-            if not pixmap.isNull():
-                self.image_label.setPixmap(pixmap.scaled(CROPPER_THUMB_IMG_WIDTH, CROPPER_THUMB_IMG_HEIGHT, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                self.image_label.setText("Error")
-        except Exception as e:
-            print(f"Error creating thumbnail for {self.image_path}: {e}")
-            traceback.print_exc() # Add traceback for more details
+        # Decode off the GUI thread; the label keeps its "..." placeholder until then
+        loader = ThumbnailLoader(
+            self.image_path, self._thumb_cache_key, thumb_disk_cache_path(self._thumb_cache_key)
+        )
+        self._thumb_loader_signals = loader.signals # Keep alive until the result is delivered
+        loader.signals.done.connect(self._on_thumb_ready)
+        QThreadPool.globalInstance().start(loader)
+
+    @pyqtSlot(str, QImage)
+    def _on_thumb_ready(self, cache_key, qimage):
+        """Convert the pooled QImage result to a pixmap and show it."""
+        self._thumb_loader_signals = None
+        if qimage.isNull():
             self.image_label.setText("Error")
+            return
+
+        pixmap = QPixmap.fromImage(qimage)
+        if pixmap.isNull():
+            self.image_label.setText("Error")
+            return
+        if cache_key:
+            QPixmapCache.insert(cache_key, pixmap)
+        self.image_label.setPixmap(pixmap)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
@@ -944,9 +1505,11 @@ class CropperThumbnailItem(QWidget):
         super().mousePressEvent(event)
 
     def set_selected(self, selected: bool):
+        if selected == self.is_selected and self.property("selected") is not None:
+            return # Unchanged; skip the stylesheet re-polish
         self.is_selected = selected
         self.setProperty("selected", "true" if selected else "false") # Use string for property
-        self.style().unpolish(self)
+        # polish() alone drops the widget's cached style rules and re-applies them
         self.style().polish(self)
         # self.update() # update is implicitly called by polish
 
@@ -960,10 +1523,21 @@ class CropperTool(QWidget):
         # Initialize variables
         self.image_paths = [] # Will be populated from list widget items if needed, or can be removed
         # self.current_image_index = -1 # No longer needed, selection driven by list widget
+        self.current_image_path = None # Path of the image shown in the crop area
         self.current_pil_image = None # Store the current PIL image for cropping
+        self._display_array = None # RGBA pixels backing the QImage built for display
+        self._qimage_scratch = None # Reused bytearray for QPixmap -> PIL conversion
+        self._gallery_appending = False # True while browse_images adds a batch
+        self._save_signals = None # Signals of the pending CropSaveWorker, if any
         self.output_dir = None
         self.thumbnail_items = [] # To store CropperThumbnailItem instances
         self.current_selected_thumbnail_item = None # To track the currently selected item
+        # Hot per-thumbnail state kept in parallel arrays (same order as thumbnail_items)
+        # so selection checks don't have to touch the widgets
+        self.thumb_paths: list = []
+        self.thumb_selected = bytearray()
+        self._thumb_index_by_path = {} # image_path -> index into the arrays above
+        self._custom_aspect_button = None # The "Custom" ratio radio button, set in init_ui
         
         # Initialize UI
         self.init_ui()
@@ -1042,6 +1616,18 @@ class CropperTool(QWidget):
         self.thumbnail_layout.addStretch()
         
         self.thumbnail_scroll.setWidget(self.thumbnail_container)
+
+        # Only thumbnails in (or near) the visible strip are decoded; re-check
+        # after scrolling or whenever the content/viewport size changes
+        self._visible_thumbs_timer = QTimer(self)
+        self._visible_thumbs_timer.setSingleShot(True)
+        self._visible_thumbs_timer.setInterval(0)
+        self._visible_thumbs_timer.timeout.connect(self._load_visible_thumbnails)
+        scroll_bar = self.thumbnail_scroll.horizontalScrollBar()
+        # The lambdas drop the signal arguments; connecting start directly
+        # would pick QTimer.start(int) and turn the scroll position into the delay
+        scroll_bar.valueChanged.connect(lambda *_: self._visible_thumbs_timer.start())
+        scroll_bar.rangeChanged.connect(lambda *_: self._visible_thumbs_timer.start())
         
         # Add widgets to thumbnail group
         thumbnail_group_layout.addLayout(btn_layout)
@@ -1180,9 +1766,12 @@ class CropperTool(QWidget):
             btn = QRadioButton(text)
             btn.w = w
             btn.h = h
-            btn.toggled.connect(self.on_aspect_ratio_changed)
+            if w < 0:
+                self._custom_aspect_button = btn
             aspect_layout.addWidget(btn)
             self.aspect_buttons.addButton(btn)
+        # One group-level connection instead of one toggled() hop per button
+        self.aspect_buttons.buttonToggled[QAbstractButton, bool].connect(self.on_aspect_ratio_changed)
         
         custom_layout = QHBoxLayout()
         self.custom_width = QSpinBox()
@@ -1336,11 +1925,12 @@ class CropperTool(QWidget):
         has_images = len(self.thumbnail_items) > 0
         self.clear_button.setEnabled(has_images)
         
-        current_item_selected = self.current_selected_thumbnail_item is not None
+        current_item_selected = any(self.thumb_selected)
         has_valid_selection = has_images and current_item_selected and hasattr(self, 'crop_area') and self.crop_area.selection_rect().isValid()
         
         # Enable/disable controls based on selection
-        self.crop_button.setEnabled(has_valid_selection and self.output_dir is not None)
+        self.crop_button.setEnabled(has_valid_selection and self.output_dir is not None
+                                    and self._save_signals is None)
         self.format_combo.setEnabled(has_valid_selection)
         self.quality_slider.setEnabled(has_valid_selection)
         self.filename_prefix_input.setEnabled(has_valid_selection)
@@ -1379,8 +1969,21 @@ class CropperTool(QWidget):
             if files:
                 self.clear_images() # Clear existing thumbnails and state first
                 self.image_paths = files # Store all paths
-                for path in files:
-                    self._add_thumbnail_to_gallery(path)
+                # Hold repaints while the batch is inserted; the layout then
+                # settles once instead of after every thumbnail. The trailing
+                # stretch is lifted out so every item is a plain append rather
+                # than an insert that shifts the layout's item list
+                layout = self.thumbnail_layout
+                self.thumbnail_container.setUpdatesEnabled(False)
+                layout.takeAt(layout.count() - 1)
+                self._gallery_appending = True
+                try:
+                    for path in files:
+                        self._add_thumbnail_to_gallery(path)
+                finally:
+                    self._gallery_appending = False
+                    layout.addStretch()
+                    self.thumbnail_container.setUpdatesEnabled(True)
                 
                 if self.thumbnail_items: # If any thumbnails were successfully added
                     # Select and load the first image
@@ -1390,25 +1993,18 @@ class CropperTool(QWidget):
     def _add_thumbnail_to_gallery(self, image_path):
         """Creates a thumbnail and adds it to the gallery."""
         try:
-            item = CropperThumbnailItem(image_path, self.thumbnail_container)
+            # Thumbnails are decoded only once the item scrolls into view
+            item = CropperThumbnailItem(image_path, self.thumbnail_container, lazy=True)
             item.clicked.connect(self._on_cropper_thumbnail_clicked)
             self.thumbnail_items.append(item)
+            self._thumb_index_by_path.setdefault(image_path, len(self.thumb_paths))
+            self.thumb_paths.append(image_path)
+            self.thumb_selected.append(0)
             
-            # Insert before the stretch item to keep thumbnails left-aligned
-            if hasattr(self, 'thumbnail_layout') and self.thumbnail_layout is not None:
-                # Remove the stretch temporarily
-                stretch = self.thumbnail_layout.takeAt(self.thumbnail_layout.count() - 1)
-                # Add the new item
-                self.thumbnail_layout.addWidget(item)
-                # Add the stretch back
-                self.thumbnail_layout.addItem(stretch)
-            
-            # Update the container's minimum size to fit all thumbnails
-            self.thumbnail_container.adjustSize()
+            self._insert_gallery_widget(item)
             
-            # Ensure the container has a minimum width to show all thumbnails
-            min_width = (CROPPER_THUMB_ITEM_WIDTH + 10) * len(self.thumbnail_items)
-            self.thumbnail_container.setMinimumWidth(min_width)
+            # The layout's size hint grows the resizable scroll widget by itself
+            self._visible_thumbs_timer.start()
 
         except Exception as e:
             print(f"Error creating thumbnail item for {image_path}: {e}")
@@ -1420,35 +2016,50 @@ class CropperTool(QWidget):
                 error_label.setStyleSheet("color: red; border: 1px solid red; padding: 5px;")
                 error_label.setFixedSize(CROPPER_THUMB_ITEM_WIDTH, CROPPER_THUMB_ITEM_HEIGHT)
                 
-                # Insert before the stretch item
-                if hasattr(self, 'thumbnail_layout') and self.thumbnail_layout is not None:
-                    # Remove the stretch temporarily
-                    stretch = self.thumbnail_layout.takeAt(self.thumbnail_layout.count() - 1)
-                    # Add the error label
-                    self.thumbnail_layout.addWidget(error_label)
-                    # Add the stretch back
-                    self.thumbnail_layout.addItem(stretch)
+                self._insert_gallery_widget(error_label)
                     
             except Exception as inner_e:
                 print(f"Error creating error label: {inner_e}")
                 traceback.print_exc()
 
+    def _insert_gallery_widget(self, widget):
+        """Add a widget to the end of the thumbnail strip."""
+        if self._gallery_appending:
+            # browse_images has taken the stretch out for the batch
+            self.thumbnail_layout.addWidget(widget)
+        else:
+            # Insert before the trailing stretch to keep thumbnails left-aligned
+            self.thumbnail_layout.insertWidget(self.thumbnail_layout.count() - 1, widget)
+
+    def _load_visible_thumbnails(self):
+        """Request thumbnails for the items within one viewport width of the visible strip."""
+        if not self.thumbnail_items:
+            return
+        margins = self.thumbnail_layout.contentsMargins()
+        step = CROPPER_THUMB_ITEM_WIDTH + self.thumbnail_layout.spacing()
+        view_left = self.thumbnail_scroll.horizontalScrollBar().value()
+        view_width = self.thumbnail_scroll.viewport().width()
+        first = max(0, (view_left - view_width - margins.left()) // step)
+        last = min(len(self.thumbnail_items) - 1, (view_left + 2 * view_width - margins.left()) // step)
+        for item in self.thumbnail_items[first:last + 1]:
+            item.ensure_thumbnail()
+
     def _on_cropper_thumbnail_clicked(self, image_path: str):
         """Handles thumbnail clicks from CropperThumbnailItem instances."""
-        clicked_item = None
-        for item in self.thumbnail_items:
-            if item.image_path == image_path:
-                clicked_item = item
-                break
-        
-        if not clicked_item:
+        index = self._thumb_index_by_path.get(image_path)
+        if index is None:
             print(f"_on_cropper_thumbnail_clicked: Could not find item for path {image_path}")
             return
+        clicked_item = self.thumbnail_items[index]
 
         if self.current_selected_thumbnail_item:
             self.current_selected_thumbnail_item.set_selected(False)
+        previous = self.thumb_selected.find(1)
+        if previous >= 0:
+            self.thumb_selected[previous] = 0
         
         clicked_item.set_selected(True)
+        self.thumb_selected[index] = 1
         self.current_selected_thumbnail_item = clicked_item
         self.load_image_into_cropper(image_path)
         self.update_ui_state()
@@ -1458,7 +2069,7 @@ class CropperTool(QWidget):
         if not image_path or not os.path.exists(image_path):
             QMessageBox.critical(self, "Error", f"Image file not found: {image_path}")
             self.crop_area.clear_pixmap()
-            self.current_pil_image = None
+            self._set_current_pil(None)
             return
             
         # Store the current image path
@@ -1468,34 +2079,67 @@ class CropperTool(QWidget):
             if hasattr(self, 'crop_area') and self.crop_area is not None:
                 self.crop_area.clear_pixmap()
             
-            # Load with PIL
-            pil_image_loaded = Image.open(image_path)
-            
-            # Store the original PIL image (or a working copy) for cropping later
-            # Ensure it's in a common format like RGB or RGBA before storing
-            if pil_image_loaded.mode not in ('RGB', 'RGBA'):
-                self.current_pil_image = pil_image_loaded.convert('RGBA') 
+            # Decode for display at no more than screen resolution; Qt's JPEG
+            # reader does this with a scaled IDCT instead of a full decode
+            qimage, source_scale = read_scaled_image(image_path, self._display_size_limit())
+            self._display_array = None
+            if not qimage.isNull():
+                pixmap = QPixmap.fromImage(qimage)
+                # Full-resolution pixels are only needed when cropping: Image.open
+                # reads just the header here and decodes on first use
+                self._set_current_pil(Image.open(image_path))
             else:
-                self.current_pil_image = pil_image_loaded.copy() # Use a copy
-
-            # For display in QPixmap, convert to RGBA then to QImage
-            display_pil_image = self.current_pil_image
-            if display_pil_image.mode != 'RGBA': # Should already be RGBA from above
-                 display_pil_image = display_pil_image.convert('RGBA')
-            
-            data = display_pil_image.tobytes('raw', 'RGBA')
-            qimage = QImage(data, display_pil_image.size[0], display_pil_image.size[1], QImage.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimage)
+                # Formats Qt cannot read (e.g. HEIC) go through PIL at full size.
+                # Store it for cropping later in a common format like RGB or RGBA
+                pil_image_loaded = Image.open(image_path)
+                if pil_image_loaded.mode not in ('RGB', 'RGBA'):
+                    with pil_image_loaded: # convert() returns an independent image
+                        self._set_current_pil(pil_image_loaded.convert('RGBA'))
+                else:
+                    # Freshly opened and not shared, so keep it instead of copying;
+                    # load() decodes and releases the file for single-frame images
+                    pil_image_loaded.load()
+                    self._set_current_pil(pil_image_loaded)
+
+                # For display, wrap the pixels in a QImage in their own layout
+                # (RGB888 or RGBA8888) so no RGBA conversion pass is needed.
+                # np.asarray takes PIL's single raw export of the loaded image;
+                # the array must outlive the QImage
+                display_pil_image = self.current_pil_image
+                display_pil_image.load()
+                self._display_array = np.asarray(display_pil_image)
+                arr = self._display_array
+                qformat = QImage.Format_RGBA8888 if display_pil_image.mode == 'RGBA' else QImage.Format_RGB888
+                qimage = QImage(arr.data, arr.shape[1], arr.shape[0], arr.strides[0], qformat)
+                pixmap = QPixmap.fromImage(qimage)
+                source_scale = 1.0
 
             if hasattr(self, 'crop_area') and self.crop_area is not None:
-                self.crop_area.set_pixmap(pixmap)
+                self.crop_area.set_pixmap(pixmap, image_path, source_scale)
             
         except Exception as e:
             QMessageBox.critical(self, "Error Loading Image", f"Could not load image: {image_path}\n{e}")
             self.crop_area.clear_pixmap()
-            self.current_pil_image = None
+            self._set_current_pil(None)
         self.update_ui_state()
 
+    def _set_current_pil(self, new_image):
+        """Replace current_pil_image, closing the previous image and its file handle."""
+        old_image = getattr(self, 'current_pil_image', None)
+        if old_image is not None and old_image is not new_image:
+            try:
+                old_image.close()
+            except Exception:
+                pass
+        self.current_pil_image = new_image
+
+    def _display_size_limit(self) -> Optional[QSize]:
+        """Largest size worth decoding for the crop view: the screen in device pixels."""
+        screen = QGuiApplication.primaryScreen()
+        if screen is None:
+            return None
+        return screen.size() * screen.devicePixelRatio()
+
     def crop_and_save(self):
         """Crop and save the current image with the selected area."""
         try:
@@ -1509,23 +2153,13 @@ class CropperTool(QWidget):
                 QMessageBox.warning(self, "Cannot Crop", "Please select a valid area to crop.")
                 return
 
-            # Get the current image dimensions
-            img_width = self.current_pil_image.width
-            img_height = self.current_pil_image.height
-
-            # Calculate crop box in PIL coordinates (left, upper, right, lower)
-            left = max(0, selection_rect.left())
-            upper = max(0, selection_rect.top())
-            right = min(img_width, selection_rect.left() + selection_rect.width())
-            lower = min(img_height, selection_rect.top() + selection_rect.height())
-
-            # Ensure valid dimensions
-            if left >= right or upper >= lower:
+            # Perform the crop; rotation and flips are applied to the cropped region only
+            cropped_image = self.crop_area.crop_source_image(self.current_pil_image)
+            if cropped_image is None:
                 QMessageBox.warning(self, "Cannot Crop", "Invalid crop dimensions. Please try again.")
                 return
-
-            # Perform the crop
-            cropped_image = self.current_pil_image.crop((left, upper, right, lower))
+            if cropped_image.mode not in ('RGB', 'RGBA'):
+                cropped_image = cropped_image.convert('RGBA') # Only the cropped region
 
             # Get output directory
             if not hasattr(self, 'output_dir') or not self.output_dir:
@@ -1533,28 +2167,18 @@ class CropperTool(QWidget):
                 if not hasattr(self, 'output_dir') or not self.output_dir:
                     return  # User cancelled directory selection
 
-            # Generate output filename
-            if hasattr(self, 'current_image_path') and self.current_image_path:
-                base_name = os.path.splitext(os.path.basename(self.current_image_path))[0]
-            else:
-                base_name = "cropped_image"
-                
-            if hasattr(self, 'filename_prefix_input') and self.filename_prefix_input.text():
-                base_name = f"{self.filename_prefix_input.text()}{base_name}"
-            if hasattr(self, 'filename_suffix_input') and self.filename_suffix_input.text():
-                base_name = f"{base_name}{self.filename_suffix_input.text()}"
+            # Generate output filename; the inputs are created in init_ui, so
+            # each is read exactly once here
+            path = self.current_image_path
+            stem = os.path.splitext(os.path.basename(path))[0] if path else "cropped_image"
+            base_name = ''.join((self.filename_prefix_input.text(), stem,
+                                 self.filename_suffix_input.text()))
 
             # Get selected format and quality
-            file_format = 'jpeg'  # Default
-            quality = 95  # Default quality
-            
-            if hasattr(self, 'format_combo'):
-                file_format = self.format_combo.currentText().lower()
-                if file_format == 'jpg':
-                    file_format = 'jpeg'
-            
-            if hasattr(self, 'quality_slider'):
-                quality = self.quality_slider.value()
+            file_format = self.format_combo.currentText().lower()
+            if file_format == 'jpg':
+                file_format = 'jpeg'
+            quality = self.quality_slider.value()
 
             # Set file extension
             ext = file_format if file_format != 'jpeg' else 'jpg'
@@ -1565,7 +2189,7 @@ class CropperTool(QWidget):
                 reply = QMessageBox.question(
                     self, 
                     'File Exists', 
-                    f'File {os.path.basename(output_path)} already exists. Overwrite?',
+                    f'File {base_name}_cropped.{ext} already exists. Overwrite?',
                     QMessageBox.Yes | QMessageBox.No, 
                     QMessageBox.No
                 )
@@ -1579,39 +2203,48 @@ class CropperTool(QWidget):
             if file_format == 'png':
                 save_kwargs['compress_level'] = 9 - (quality // 11)  # Map 0-100 to 9-0
 
-            # Convert to RGB for JPEG if needed
-            if file_format == 'jpeg' and cropped_image.mode in ('RGBA', 'LA'):
-                background = Image.new('RGB', cropped_image.size, (255, 255, 255))
-                background.paste(cropped_image, mask=cropped_image.split()[-1])
-                cropped_image = background
-            elif cropped_image.mode == 'P':
-                cropped_image = cropped_image.convert('RGB')
-
-            # Save the image
-            cropped_image.save(output_path, format=file_format.upper(), **save_kwargs)
-            
-            # Show success message
-            QMessageBox.information(self, "Success", f"Image successfully saved to:\n{output_path}")
-            
-            # Update the current PIL image to the cropped version
-            self.current_pil_image = cropped_image
+            # Flattening and encoding run on the thread pool; the worker keeps
+            # the only reference to the crop until it reports back
+            worker = CropSaveWorker(cropped_image, output_path, file_format, save_kwargs)
+            del cropped_image
+            self._save_signals = worker.signals # Keep alive until the result is delivered
+            worker.signals.finished.connect(self._on_crop_saved)
+            worker.signals.failed.connect(self._on_crop_save_failed)
+            self.crop_button.setEnabled(False)
+            QThreadPool.globalInstance().start(worker)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save cropped image: {str(e)}")
             print(f"Error in crop_and_save: {str(e)}")
-            import traceback
             traceback.print_exc()
     
-    def on_aspect_ratio_changed(self, checked):
-        """Handle aspect ratio radio button toggled."""
+    @pyqtSlot(str)
+    def _on_crop_saved(self, output_path):
+        """Report a finished save.
+
+        current_pil_image stays the untransformed source: the crop area keeps
+        its selection, rotation and flips, so the next crop maps from it again.
+        """
+        self._save_signals = None
+        QMessageBox.information(self, "Success", f"Image successfully saved to:\n{output_path}")
+        self.update_ui_state()
+
+    @pyqtSlot(str)
+    def _on_crop_save_failed(self, message):
+        """Report a save that failed on the worker thread."""
+        self._save_signals = None
+        QMessageBox.critical(self, "Error", f"Failed to save cropped image: {message}")
+        self.update_ui_state()
+
+    def on_aspect_ratio_changed(self, btn, checked):
+        """Handle the aspect ratio button group toggling a button."""
         if not checked:
-            return
+            return # The button being unchecked; its replacement reports separately
             
-        btn = self.sender()
-        if btn.text() == "Free Form":
+        if btn.w == 0:
             # No fixed aspect ratio
             self.crop_area.set_aspect_ratio(0, 0)
-        elif btn.text() == "Custom":
+        elif btn is self._custom_aspect_button:
             # Use custom values
             width = self.custom_width.value()
             height = self.custom_height.value()
@@ -1623,12 +2256,7 @@ class CropperTool(QWidget):
     
     def update_custom_aspect_ratio(self):
         """Update aspect ratio when custom values change."""
-        custom_btn = None
-        for btn in self.aspect_buttons.buttons():
-            if btn.text() == "Custom":
-                custom_btn = btn
-                break
-                
+        custom_btn = self._custom_aspect_button
         if custom_btn and custom_btn.isChecked():
             width = self.custom_width.value()
             height = self.custom_height.value()
@@ -1655,27 +2283,38 @@ class CropperTool(QWidget):
     def _handle_rotate_left(self):
         if hasattr(self, 'crop_area') and self.crop_area.original_pixmap:
             self.crop_area.rotate_image(-90) # Counter-clockwise
-            self._update_pil_image_safely()
+            self._ensure_pil_source()
 
     def _handle_rotate_right(self):
         if hasattr(self, 'crop_area') and self.crop_area.original_pixmap:
             self.crop_area.rotate_image(90) # Clockwise
-            self._update_pil_image_safely()
+            self._ensure_pil_source()
 
     def _handle_flip_horizontal(self):
         if hasattr(self, 'crop_area') and self.crop_area.original_pixmap:
             self.crop_area.flip_horizontal_image()
-            self._update_pil_image_safely()
+            self._ensure_pil_source()
 
     def _handle_flip_vertical(self):
         if hasattr(self, 'crop_area') and self.crop_area.original_pixmap:
             self.crop_area.flip_vertical_image()
-            self._update_pil_image_safely()
+            self._ensure_pil_source()
             
+    def _ensure_pil_source(self):
+        """Make sure a PIL source is available after a rotate/flip.
+
+        The source image is deliberately left untransformed: crop_source_image()
+        applies the rotation and flips to the cropped region only, so nothing
+        needs to be re-decoded here. Reloading is just a fallback for when no
+        PIL image is held.
+        """
+        if self.current_pil_image is None:
+            self._update_pil_image_safely()
+
     def _update_pil_image_safely(self):
         """Safely update the PIL image from the current QPixmap."""
         if not hasattr(self, 'crop_area') or not self.crop_area.original_pixmap:
-            self.current_pil_image = None
+            self._set_current_pil(None)
             return
             
         try:
@@ -1683,17 +2322,21 @@ class CropperTool(QWidget):
             current_path = getattr(self, 'current_image_path', None)
             if current_path and os.path.exists(current_path):
                 # Reload from original file for better quality
-                self.current_pil_image = Image.open(current_path)
+                self._set_current_pil(Image.open(current_path))
                 return
                 
-            # Fallback to QPixmap conversion if no file path is available
-            qimage = self.crop_area.original_pixmap.toImage()
+            # Fallback to QPixmap conversion if no file path is available; the
+            # pixmap is turned back to the source orientation first, since
+            # crop_source_image() applies the rotation to the crop itself
+            pixmap = self.crop_area.source_pixmap()
+            qimage = pixmap.toImage() if pixmap else QImage()
             if qimage.isNull():
-                self.current_pil_image = None
+                self._set_current_pil(None)
                 return
                 
-            # Convert to ARGB32 format for reliable processing
-            qimage = qimage.convertToFormat(QImage.Format_ARGB32)
+            # RGBA8888 is byte-ordered R, G, B, A on every platform, which is
+            # exactly PIL's raw 'RGBA' layout
+            qimage = qimage.convertToFormat(QImage.Format_RGBA8888)
             
             # Get image data
             width = qimage.width()
@@ -1702,33 +2345,40 @@ class CropperTool(QWidget):
             
             # Ensure we have valid image data
             if not ptr or width <= 0 or height <= 0:
-                self.current_pil_image = None
+                self._set_current_pil(None)
                 return
                 
-            # Convert QImage to numpy array
-            try:
-                # For PyQt5
-                ptr.setsize(qimage.byteCount())
-            except AttributeError:
-                # For PySide2 or other bindings
-                ptr.setsize(height * qimage.bytesPerLine())
-                
-            arr = np.frombuffer(ptr, np.uint8).reshape((height, width, 4))  # RGBA
-            
-            # Create PIL image and ensure it's in RGB/RGBA mode
-            pil_image = Image.fromarray(arr, 'RGBA')
-            if pil_image.mode == 'RGBA' and not pil_image.getextrema()[3] == (255, 255):
+            bytes_per_line = qimage.bytesPerLine()
+            required = height * bytes_per_line
+            ptr.setsize(required)
+
+            # Copy into a pooled buffer instead of allocating a frame-sized
+            # array per rotate/flip; it only grows when a larger image arrives
+            scratch = self._qimage_scratch
+            if scratch is None or len(scratch) < required:
+                scratch = self._qimage_scratch = bytearray(required)
+            view = memoryview(scratch)[:required]
+            view[:] = memoryview(ptr)[:required]
+
+            # Zero-copy wrap: PIL treats the image as read-only and copies on
+            # the first in-place edit, so the scratch buffer is never mutated
+            pil_image = Image.frombuffer('RGBA', (width, height), view,
+                                         'raw', 'RGBA', bytes_per_line, 1)
+
+            # RGBA8888 rows are never padded, so every fourth byte is alpha;
+            # one numpy reduction replaces PIL's per-band extrema pass
+            alpha = np.frombuffer(scratch, np.uint8, count=required)[3::4]
+            if alpha.min() == 255:
                 # If no alpha channel is used, convert to RGB
                 pil_image = pil_image.convert('RGB')
             
             # Store the PIL image
-            self.current_pil_image = pil_image
+            self._set_current_pil(pil_image)
             
         except Exception as e:
             print(f"Error updating PIL image: {str(e)}")
-            import traceback
             traceback.print_exc()
-            self.current_pil_image = None
+            self._set_current_pil(None)
     
     def _update_pil_image_from_crop_area(self):
         """Legacy method that now just calls the safe update method."""
@@ -1744,20 +2394,19 @@ class CropperTool(QWidget):
             self.crop_area.clear_pixmap()
         
         # Clear the PIL image reference
-        self.current_pil_image = None
+        self._set_current_pil(None)
         
         # Clear the thumbnail items
         for item in self.thumbnail_items:
             item.setParent(None)
             item.deleteLater()
         self.thumbnail_items.clear()
+        self.thumb_paths.clear()
+        self.thumb_selected.clear()
+        self._thumb_index_by_path.clear()
         
         # Reset the image paths
         self.image_paths = []
         
-        # Reset the container's minimum width
-        if hasattr(self, 'thumbnail_container'):
-            self.thumbnail_container.setMinimumWidth(0)
-        
         # Update the UI state
         self.update_ui_state()
@@ -1,8 +1,10 @@
 import os
 import sys
+import argparse
 import subprocess
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 def setup_logging():
     """Set up logging to file and console."""
@@ -15,29 +17,47 @@ def setup_logging():
         ]
     )
 
-def clean():
-    """Clean up previous builds."""
-    for dir_name in ['build', 'dist']:
-        if os.path.exists(dir_name):
-            logging.info(f"Removing {dir_name} directory...")
-            shutil.rmtree(dir_name, ignore_errors=True)
+def _remove_dir(dir_name):
+    if os.path.exists(dir_name):
+        logging.info(f"Removing {dir_name} directory...")
+        shutil.rmtree(dir_name, ignore_errors=True)
 
-def build():
-    """Build the executable using PyInstaller with debug options."""
+def clean(full=False):
+    """Clean up previous builds.
+
+    dist/ is always removed. build/ is PyInstaller's work directory and holds
+    its analysis cache, so it is only removed for a full (--full) build; only
+    then are there two trees, and they are deleted concurrently.
+    """
+    if not full:
+        _remove_dir('dist')
+        return
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_remove_dir, ['build', 'dist']))
+
+def build(debug=False, onefile=False):
+    """Build the executable using PyInstaller.
+
+    The defaults give a fast developer build: a one-folder bundle with no
+    final pack step, reusing the analysis cache in build/. Pass debug/onefile
+    (or --full on the command line) for the clean, debug-instrumented
+    single-file build.
+    """
     logging.info("Starting build process...")
     
     # Ensure the assets directory exists
     os.makedirs('assets', exist_ok=True)
     
-    # PyInstaller command with debug options
     cmd = [
         sys.executable, '-m', 'PyInstaller',
         '--name=ImageMaster',
         '--windowed',
-        '--onefile',
-        '--clean',
-        '--debug=all',
-        '--log-level=DEBUG',
+        '--onefile' if onefile else '--onedir',
+    ]
+    if debug:
+        # --clean also drops PyInstaller's own cache, forcing a full re-analysis
+        cmd += ['--clean', '--debug=all', '--log-level=DEBUG']
+    cmd += [
         '--noconfirm',
         '--add-data=assets;assets',
         '--add-data=tools;tools',
@@ -55,10 +75,15 @@ def build():
         sys.exit(1)
 
 def main():
+    parser = argparse.ArgumentParser(description="Build the ImageMaster executable.")
+    parser.add_argument('--full', action='store_true',
+                        help="clean single-file build with PyInstaller debug output")
+    args = parser.parse_args()
+
     setup_logging()
-    logging.info("=== Starting ImageMaster Debug Build ===")
-    clean()
-    build()
+    logging.info("=== Starting ImageMaster %s Debug Build ===", "Full" if args.full else "Fast")
+    clean(full=args.full)
+    build(debug=args.full, onefile=args.full)
     logging.info("Build process completed. Check build.log for details.")
 
 if __name__ == "__main__":
@@ -1,23 +1,304 @@
 import os
+import io
+import multiprocessing
+import hashlib
+import importlib.util
 import tempfile
+import struct
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QProgressBar, QGroupBox, QMessageBox, QCheckBox,
     QSizePolicy, QComboBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, pyqtSlot, QStandardPaths,
+    QObject, QRunnable, QThreadPool, QTimer)
+from PyQt5.QtGui import QImage, QGuiApplication
+import numpy as np
 from PIL import Image
 from utils.base_tool import BaseTool
 from utils.ui_components import OutputDirSelector, FileControls
 from utils.image_utils import ImageData, load_image
 from utils.file_utils import create_directory
 
+# pillow-heif (and libheif with it) is only imported once HEIC support is
+# actually needed; see ensure_heif_opener()
+HEIC_SUPPORT = importlib.util.find_spec("pillow_heif") is not None
+if not HEIC_SUPPORT:
+    print("Warning: pillow-heif not found. HEIC support will be disabled.")
+pillow_heif = None
+
+
+def ensure_heif_opener() -> bool:
+    """Import pillow-heif and register its Pillow opener on first use.
+
+    Returns:
+        True if HEIC/HEIF files can be opened.
+    """
+    global pillow_heif, HEIC_SUPPORT
+    if pillow_heif is None and HEIC_SUPPORT:
+        try:
+            import pillow_heif as heif_module
+            heif_module.register_heif_opener()
+            pillow_heif = heif_module
+            set_heif_decode_threads(os.cpu_count() or 1)
+        except Exception as e:
+            print(f"Error initializing HEIC support: {e}")
+            HEIC_SUPPORT = False
+    return pillow_heif is not None
+
+def set_heif_decode_threads(count: int) -> None:
+    """Set how many threads libheif may use to decode one image.
+
+    Older pillow-heif releases have no such option and keep their default.
+    """
+    if pillow_heif is not None and hasattr(pillow_heif.options, 'DECODE_THREADS'):
+        pillow_heif.options.DECODE_THREADS = max(1, count)
+
 try:
-    import pillow_heif
-    HEIC_SUPPORT = True
+    import simplejpeg  # libjpeg-turbo encoder, used for all JPEG output when available
+    SIMPLEJPEG_AVAILABLE = True
 except ImportError:
-    print("Warning: pillow-heif not found. HEIC support will be disabled.")
-    HEIC_SUPPORT = False
+    SIMPLEJPEG_AVAILABLE = False
+
+try:
+    import cv2  # SIMD area resampling for the main preview
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+HEIC_THUMB_SIZE = (100, 100)  # Gallery thumbnails, as stored in the disk cache
+THUMB_CACHE_QUALITY = 85  # JPEG quality of cached thumbnails
+THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Oldest thumbnails are evicted beyond this
+PREVIEW_CACHE_SIZE = 8  # Decoded previews kept in memory, each capped at screen size
+OUTPUT_FORMATS = {'JPEG': ('jpg', 'JPEG'), 'PNG': ('png', 'PNG')}  # combo text -> (extension, PIL format)
+PNG_COMPRESS_LEVEL = 1  # Default zlib level for PNG output; photos barely shrink at higher levels
+JPEG_QUALITIES = [("Maximum (100)", 100), ("High (90)", 90), ("Good (80)", 80),
+                  ("Medium (70)", 70), ("Low (60)", 60)]
+PNG_COMPRESS_LEVELS = [("Fast (1)", 1), ("Balanced (4)", 4), ("Small (9)", 9)]
+
+_thumb_cache_dir = None  # Resolved on first use by heic_thumb_cache_path()
+_pixel_buffer = None  # Per-process scratch for repacking padded rows; grows to the largest image
+
+
+def heic_thumb_cache_path(path: str) -> Optional[str]:
+    """Return the cached thumbnail file for an image, or None if unavailable.
+
+    Files live under <CacheLocation>/heic_thumbs/ and are named by the SHA-1 of
+    the path, mtime, size and thumbnail size, so an edited file gets a new entry.
+    """
+    global _thumb_cache_dir
+    if _thumb_cache_dir is None:
+        base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        _thumb_cache_dir = os.path.join(base, "heic_thumbs") if base else ""
+        if _thumb_cache_dir:
+            try:
+                os.makedirs(_thumb_cache_dir, exist_ok=True)
+            except OSError:
+                _thumb_cache_dir = ""
+    if not _thumb_cache_dir:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}:{HEIC_THUMB_SIZE[0]}x{HEIC_THUMB_SIZE[1]}"
+    return os.path.join(_thumb_cache_dir, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jpg")
+
+
+def evict_thumb_cache(max_bytes: int = THUMB_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently used cached thumbnails until the cache fits max_bytes."""
+    if not _thumb_cache_dir:
+        return
+    try:
+        entries = [(e.stat().st_atime, e.stat().st_size, e.path)
+                   for e in os.scandir(_thumb_cache_dir) if e.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(entry_path)
+            total -= size
+        except OSError:
+            pass
+
+def _init_convert_process(decode_threads: int = 1) -> None:
+    """Register the HEIF opener in a freshly started conversion process.
+
+    Args:
+        decode_threads: libheif threads per image, so that processes times
+            threads roughly matches the core count
+    """
+    ensure_heif_opener()
+    set_heif_decode_threads(decode_threads)
+    if CV2_AVAILABLE:
+        cv2.setNumThreads(1)  # The pool already runs one process per core
+
+
+def _convert_one(task: tuple) -> str:
+    """Convert a single image; runs in a worker process, so it must stay picklable.
+
+    Args:
+        task: (input_path, output_dir, output_format, quality, preserve_metadata,
+            png_level), where output_format is a key of OUTPUT_FORMATS and
+            output_dir already exists
+
+    Returns:
+        Path of the written file.
+    """
+    input_path, output_dir, output_format, quality, preserve_metadata, png_level = task
+    try:
+        ext, pil_format = OUTPUT_FORMATS[output_format]
+        filename = f"{os.path.splitext(os.path.basename(input_path))[0]}.{ext}"
+        output_path = os.path.join(output_dir, filename)
+        
+        is_jpeg = pil_format == 'JPEG'
+        if (is_jpeg and SIMPLEJPEG_AVAILABLE and ensure_heif_opener()
+                and input_path.lower().endswith(('.heic', '.heif'))
+                and _encode_heic_jpeg(input_path, output_path, quality, preserve_metadata)):
+            return output_path
+        
+        with Image.open(input_path) as img:
+            # Raw EXIF/XMP bytes from the container, passed through unparsed
+            exif = img.info.get('exif') if preserve_metadata else None
+            xmp = img.info.get('xmp') if preserve_metadata else None
+            # Convert once, up front; JPEG has no alpha, PNG keeps it
+            if is_jpeg:
+                # simplejpeg takes RGBA as is and skips the alpha channel itself
+                if img.mode != 'RGB' and not (img.mode == 'RGBA' and SIMPLEJPEG_AVAILABLE):
+                    img = img.convert('RGB')
+            elif img.mode not in ('RGB', 'RGBA'):
+                has_alpha = 'A' in img.mode or 'transparency' in img.info
+                img = img.convert('RGBA' if has_alpha else 'RGB')
+            
+            if is_jpeg and SIMPLEJPEG_AVAILABLE:
+                jpeg = simplejpeg.encode_jpeg(np.asarray(img), colorspace=img.mode,
+                                              **_jpeg_options(quality))
+                _write_jpeg(output_path, jpeg, exif, xmp)
+                return output_path
+            
+            if not is_jpeg and CV2_AVAILABLE and not exif:
+                # libpng through OpenCV with the FILTERED strategy, which suits
+                # photographic content, instead of Pillow's per-row filter trials
+                code = cv2.COLOR_RGBA2BGRA if img.mode == 'RGBA' else cv2.COLOR_RGB2BGR
+                pixels = cv2.cvtColor(np.asarray(img), code)
+                ok, buf = cv2.imencode('.png', pixels, [
+                    cv2.IMWRITE_PNG_COMPRESSION, png_level,
+                    cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_FILTERED])
+                if ok:
+                    buf.tofile(output_path)
+                    return output_path
+            
+            save_kwargs = {'exif': exif} if exif else {}
+            if is_jpeg:
+                # Optimized, progressive Huffman tables make files 3-7% smaller
+                # but cost encode time, so only lower qualities (sized for the
+                # web) pay for them; full chroma is kept from quality 90 up
+                small = quality <= 80
+                save_kwargs.update(quality=quality, subsampling=0 if quality >= 90 else 2,
+                                   progressive=small, optimize=small)
+                if xmp:
+                    save_kwargs['xmp'] = xmp
+            else:
+                save_kwargs['compress_level'] = png_level
+            # Encode in memory, then hand the file to the OS in one write
+            buffer = io.BytesIO()
+            img.save(buffer, format=pil_format, **save_kwargs)
+            _write_file(output_path, buffer.getbuffer())
+        return output_path
+                    
+    except Exception as e:
+        raise Exception(f"Failed to convert {input_path}: {e}")
+
+
+def _encode_heic_jpeg(input_path: str, output_path: str, quality: int,
+                      preserve_metadata: bool) -> bool:
+    """Write a HEIC file as JPEG via libheif and libjpeg-turbo, skipping PIL.
+
+    Returns False, without writing anything, for images this path cannot
+    handle, so the caller can fall back to Pillow.
+    """
+    heif = pillow_heif.open_heif(input_path, convert_hdr_to_8bit=True)
+    if heif.mode not in ('RGB', 'RGBA'):
+        return False
+    
+    # Wrap libheif's decoded rows directly; only padded rows need a copy
+    width, height = heif.size
+    channels = len(heif.mode)
+    rows = np.frombuffer(heif.data, np.uint8).reshape(height, heif.stride)
+    pixels = _packed_pixels(rows, width * channels).reshape(height, width, channels)
+    jpeg = simplejpeg.encode_jpeg(pixels, colorspace=heif.mode, **_jpeg_options(quality))
+    
+    # Metadata is copied as the raw bytes libheif read from the container
+    exif = heif.info.get('exif') if preserve_metadata else None
+    xmp = heif.info.get('xmp') if preserve_metadata else None
+    _write_jpeg(output_path, jpeg, exif, xmp)
+    return True
+
+
+def _jpeg_options(quality: int) -> Dict[str, Any]:
+    """simplejpeg encoder settings for a quality; high qualities keep full chroma."""
+    return {'quality': quality, 'fastdct': True,
+            'colorsubsampling': '444' if quality >= 90 else '420'}
+
+
+def _write_jpeg(output_path: str, jpeg: bytes, exif: Optional[bytes],
+                xmp: Optional[bytes]) -> None:
+    """Write encoded JPEG bytes, inserting raw EXIF/XMP segments if given."""
+    if exif or xmp:
+        segments = [jpeg[:2]]  # SOI
+        # EXIF, then XMP, each in an APP1 segment straight after SOI
+        if exif:
+            if not exif.startswith(b'Exif\x00\x00'):
+                exif = b'Exif\x00\x00' + exif
+            segments.append(_app1_segment(exif))
+        if xmp:
+            segments.append(_app1_segment(b'http://ns.adobe.com/xap/1.0/\x00' + xmp))
+        segments.append(jpeg[2:])
+        jpeg = b''.join(segments)
+    _write_file(output_path, jpeg)
+
+
+def _write_file(path: str, data) -> None:
+    """Write an encoded file with unbuffered os.write calls (one, unless the OS splits it)."""
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _packed_pixels(rows: np.ndarray, row_bytes: int) -> np.ndarray:
+    """Return rows trimmed to row_bytes as a C-contiguous array.
+
+    Unpadded rows are returned as a view. Padded rows are copied into a
+    buffer reused by every call in this process, so a long batch does not
+    allocate a fresh full-size array per image. The result is only valid
+    until the next call.
+    """
+    global _pixel_buffer
+    if rows.shape[1] == row_bytes:
+        return rows
+    size = rows.shape[0] * row_bytes
+    if _pixel_buffer is None or _pixel_buffer.size < size:
+        _pixel_buffer = np.empty(size, np.uint8)
+    packed = _pixel_buffer[:size].reshape(rows.shape[0], row_bytes)
+    np.copyto(packed, rows[:, :row_bytes])
+    return packed
+
+
+def _app1_segment(payload: bytes) -> bytes:
+    """Return a JPEG APP1 segment for payload, or nothing if it is too large for one."""
+    if len(payload) + 2 > 0xFFFF:
+        return b''
+    return b'\xff\xe1' + struct.pack('>H', len(payload) + 2) + payload
+
 
 class HEICConverterTool(BaseTool):
     def __init__(self):
@@ -25,16 +306,27 @@ class HEICConverterTool(BaseTool):
         self.worker_thread = None
         self.conversion_in_progress = False
         self.heic_supported = HEIC_SUPPORT
-        
-        if self.heic_supported:
-            try:
-                pillow_heif.register_heif_opener()
-            except Exception as e:
-                print(f"Error initializing HEIC support: {e}")
-                self.heic_supported = False
+        self._thumb_batch = 0  # Bumped per gallery refresh so late results are dropped
+        self._thumb_paths: List[str] = []
+        self._thumb_requested: List[bool] = []  # Per slot: decode task already started
+        self._thumb_pending = 0
+        self._preview_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # (path, mtime) -> (ImageData, QImage)
+        self._meta: Dict[str, tuple] = {}  # path -> (size_bytes, width, height, mode), from headers
         
         super().__init__("HEIC Converter")
         
+        # Decode only the thumbnails near the viewport; scrolling is coalesced
+        # so a fast drag starts one pass instead of one per scrollbar step
+        self._visible_thumbs_timer = QTimer(self)
+        self._visible_thumbs_timer.setSingleShot(True)
+        self._visible_thumbs_timer.setInterval(50)
+        self._visible_thumbs_timer.timeout.connect(self._load_visible_thumbnails)
+        scroll_bar = self.thumbnail_gallery.scroll_area.verticalScrollBar()
+        # The lambdas drop the signal arguments; connecting start directly
+        # would pick QTimer.start(int) and turn the scroll position into the delay
+        scroll_bar.valueChanged.connect(lambda *_: self._visible_thumbs_timer.start())
+        scroll_bar.rangeChanged.connect(lambda *_: self._visible_thumbs_timer.start())
+        
         # Try to create output directory, fallback to temp if needed
         if not create_directory(self.output_dir)[0]:
             self.output_dir = str(Path(tempfile.gettempdir()) / "imageconverter" / "heic_converted")
@@ -82,15 +374,25 @@ class HEICConverterTool(BaseTool):
         quality_layout = QHBoxLayout()
         quality_layout.addWidget(QLabel("Quality (1-100):"))
         self.quality_spin = QComboBox()
-        self.quality_spin.addItems(["Maximum (100)", "High (90)", "Good (80)", "Medium (70)", "Low (60)"])
+        for label, quality in JPEG_QUALITIES:
+            self.quality_spin.addItem(label, quality)
         self.quality_spin.setCurrentIndex(1)  # Default to High (90)
         quality_layout.addWidget(self.quality_spin)
         
+        # PNG compression; only affects PNG output
+        png_layout = QHBoxLayout()
+        png_layout.addWidget(QLabel("PNG Compression:"))
+        self.png_level_combo = QComboBox()
+        for label, level in PNG_COMPRESS_LEVELS:
+            self.png_level_combo.addItem(label, level)
+        png_layout.addWidget(self.png_level_combo)
+        
         self.preserve_metadata = QCheckBox("Preserve metadata")
         self.preserve_metadata.setChecked(True)
         
         settings_layout.addLayout(format_layout)
         settings_layout.addLayout(quality_layout)
+        settings_layout.addLayout(png_layout)
         settings_layout.addWidget(self.preserve_metadata)
         settings_group.setLayout(settings_layout)
         
@@ -111,6 +413,7 @@ class HEICConverterTool(BaseTool):
     
     def browse_images(self):
         """Handle image selection with HEIC/HEIF file filter."""
+        self.heic_supported = ensure_heif_opener()
         if not self.heic_supported:
             QMessageBox.warning(self, 'HEIC Not Supported', 
                 'HEIC support is not available. Please install pillow-heif package.')
@@ -126,6 +429,11 @@ class HEICConverterTool(BaseTool):
             self.file_controls.update_file_count(len(self.image_paths))
             self.convert_btn.setEnabled(True)
             
+            # Read sizes and dimensions from the file headers in the background
+            scan = HEICMetadataTask(list(paths))
+            scan.signals.done.connect(self._on_metadata_ready)
+            QThreadPool.globalInstance().start(scan)
+            
             # Update preview with first image
             if self.image_paths:
                 self.current_path = self.image_paths[0]
@@ -135,6 +443,9 @@ class HEICConverterTool(BaseTool):
     def clear_images(self):
         """Clear all selected images and reset tool state."""
         super().clear_images()
+        self._thumb_batch += 1
+        self._preview_cache.clear()
+        self._meta.clear()
         self.image_paths = []
         self.file_controls.update_file_count(0)
         self.convert_btn.setEnabled(False)
@@ -151,13 +462,61 @@ class HEICConverterTool(BaseTool):
         """Update the thumbnail gallery with current images."""
         if not hasattr(self, 'thumbnail_gallery') or not hasattr(self, 'image_paths') or not self.image_paths:
             return
+        ensure_heif_opener()  # Before any task can reach Image.open
             
         # Clear existing thumbnails
         self.thumbnail_gallery.clear()
+        self._thumb_batch += 1
+        self._thumb_paths = list(self.image_paths)
+        self._thumb_requested = [False] * len(self._thumb_paths)
+        self._thumb_pending = 0
         
-        # Add thumbnails for all images
-        for path in self.image_paths:
-            self.thumbnail_gallery.add_thumbnail(path)
+        # Lay out every slot first so the grid is stable; decoding starts
+        # only for the slots that are on (or near) screen
+        for path in self._thumb_paths:
+            self.thumbnail_gallery.add_placeholder(path)
+        self._visible_thumbs_timer.start()
+    
+    def _load_visible_thumbnails(self) -> None:
+        """Start decode tasks for the slots within one viewport height of the visible area."""
+        if not self._thumb_paths:
+            return
+        gallery = self.thumbnail_gallery
+        gallery.grid_layout.activate()  # Make sure new slots have their geometry
+        view_top = gallery.scroll_area.verticalScrollBar().value()
+        view_height = gallery.scroll_area.viewport().height()
+        top, bottom = view_top - view_height, view_top + 2 * view_height
+        
+        # HEIC is decoded on the global pool, and only on a disk cache miss
+        pool = QThreadPool.globalInstance()
+        for index, path in enumerate(self._thumb_paths):
+            if self._thumb_requested[index]:
+                continue
+            slot = gallery.thumbnails.get(path)
+            if slot is None or slot.geometry().bottom() < top or slot.geometry().top() > bottom:
+                continue
+            self._thumb_requested[index] = True
+            preview = self._cached_preview_image(path)
+            if preview is not None:
+                # Already decoded for the main preview (the first image of a
+                # selection always is); shrink that instead of decoding again
+                self.thumbnail_gallery.set_thumbnail_image(path, preview.scaled(
+                    HEIC_THUMB_SIZE[0], HEIC_THUMB_SIZE[1], Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                continue
+            self._thumb_pending += 1
+            task = HEICThumbnailTask(self._thumb_batch, index, path, heic_thumb_cache_path(path))
+            task.signals.done.connect(self._on_thumbnail_ready)
+            pool.start(task)
+    
+    @pyqtSlot(int, int, QImage)
+    def _on_thumbnail_ready(self, batch: int, index: int, image: QImage) -> None:
+        """Show a thumbnail decoded on the thread pool."""
+        if batch != self._thumb_batch:
+            return  # The gallery was refreshed or cleared since the task started
+        self.thumbnail_gallery.set_thumbnail_image(self._thumb_paths[index], image)
+        self._thumb_pending -= 1
+        if self._thumb_pending == 0:
+            evict_thumb_cache()
                 
     def set_output_directory(self, path: Optional[str] = None) -> None:
         """Set the output directory and update the UI."""
@@ -184,44 +543,139 @@ class HEICConverterTool(BaseTool):
             print(f"Error loading image {path}: {str(e)}")
             return None
             
-    def _create_temp_preview(self, img, suffix: str = '.jpg') -> str:
-        """Create a temporary preview file for the given image."""
-        fd, temp_path = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
+    def _preview_entry(self, path: str) -> Optional[tuple]:
+        """Return the cached (ImageData, QImage) preview for a path.
+        
+        Entries are keyed by (path, mtime) and kept in LRU order, so a file
+        is decoded once per version. The image is shrunk to the screen size
+        and converted to a QImage before caching; width, height and mode of
+        the ImageData still describe the original file.
+        """
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            key = None
+        entry = self._preview_cache.get(key)
+        if entry is not None:
+            self._preview_cache.move_to_end(key)
+            return entry
+        
+        screen = QGuiApplication.primaryScreen()
+        limit = screen.size() * screen.devicePixelRatio() if screen is not None else None
+        if str(path).lower().endswith(('.heic', '.heif')) and ensure_heif_opener():
+            entry = self._decode_heif_preview(path, limit)
+        if entry is None:
+            data = self.load_image_data(path)
+            if data is None:
+                return None
+            if limit is not None:
+                data.image.thumbnail((limit.width(), limit.height()))
+            img = data.image if data.image.mode == 'RGB' else data.image.convert('RGB')
+            # copy() detaches the QImage from the Python bytes it was built on
+            image = QImage(img.tobytes(), img.width, img.height,
+                           img.width * 3, QImage.Format_RGB888).copy()
+            entry = (data, image)
+        if key is not None:
+            self._preview_cache[key] = entry
+            while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        return entry
+    
+    def _decode_heif_preview(self, path: str, limit=None) -> Optional[tuple]:
+        """Decode a HEIC straight into a QImage, without a PIL image in between.
+        
+        The QImage wraps libheif's decoded plane, so the only copy made is the
+        one that scales it to limit (or detaches it when no scaling is needed).
+        The ImageData carries the original size and mode but no PIL image.
+        
+        Returns:
+            (ImageData, QImage), or None to fall back to the PIL loader.
+        """
         try:
-            img.convert('RGB').save(temp_path, 'JPEG', quality=90)
-            return temp_path
-        except Exception:
-            os.path.exists(temp_path) and os.unlink(temp_path)
-            raise
+            heif = pillow_heif.open_heif(path, convert_hdr_to_8bit=True)
+            if heif.mode not in ('RGB', 'RGBA'):
+                return None
+            width, height = heif.size
+            fmt = QImage.Format_RGB888 if heif.mode == 'RGB' else QImage.Format_RGBA8888
+            # heif must outlive this QImage, which does not own the plane
+            plane = QImage(heif.data, width, height, heif.stride, fmt)
+            if limit is not None and (width > limit.width() or height > limit.height()):
+                image = plane.scaled(limit, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            else:
+                image = plane.copy()
+            data = ImageData(image=None, path=path, width=width, height=height,
+                             format='HEIF', mode=heif.mode, size_bytes=os.path.getsize(path),
+                             metadata={})
+            return data, image
+        except Exception as e:
+            print(f"Error decoding HEIC preview {path}: {e}")
+            return None
+    
+    def _cached_preview_image(self, path: str) -> Optional[QImage]:
+        """Return the cached preview QImage for a path, without decoding on a miss."""
+        for cached_path, mtime in self._preview_cache:
+            if cached_path == path:
+                try:
+                    if os.stat(path).st_mtime_ns != mtime:
+                        continue
+                except OSError:
+                    return None
+                return self._preview_cache[(cached_path, mtime)][1]
+        return None
+    
+    def _preview_data(self, path: str) -> Optional[ImageData]:
+        """Return the decoded preview for a path, decoding only on a cache miss."""
+        entry = self._preview_entry(path)
+        return entry[0] if entry is not None else None
+    
+    def load_preview_image(self):
+        """Return the cached preview image; resizing only rescales it."""
+        entry = self._preview_entry(self.current_path)
+        if entry is None:
+            return super().load_preview_image()
+        return entry[1]
+    
+    @pyqtSlot(dict)
+    def _on_metadata_ready(self, meta: dict) -> None:
+        """Store the header scan results and refresh the info line if it is affected."""
+        self._meta.update(meta)
+        if self.current_path in meta:
+            self._show_size_info(self.current_path)
+    
+    def _show_size_info(self, path: str) -> None:
+        """Show the size line for a file from its header scan.
+        
+        Falls back to a stat and the decoded preview when the scan has not
+        reached the file yet.
+        """
+        meta = self._meta.get(path)
+        if meta is None:
+            if self.current_preview is None:
+                return
+            try:
+                size_bytes = os.path.getsize(path)
+            except OSError:
+                return
+            meta = (size_bytes, self.current_preview.width,
+                    self.current_preview.height, self.current_preview.mode)
+        size_bytes, width, height, mode = meta
+        self.size_info.setText(
+            f"{width} × {height} px • {size_bytes / 1024:.1f} KB • {mode.upper()}")
     
     def update_main_preview(self):
         """Update the main preview with the current image."""
         if not hasattr(self, 'current_path') or not self.current_path:
             return
+        ensure_heif_opener()
             
         try:
-            self.current_preview = self.load_image_data(self.current_path)
+            self.current_preview = self._preview_data(self.current_path)
             if not self.current_preview:
                 raise ValueError("Failed to load image data")
             
-            if not str(self.current_path).lower().endswith(('.heic', '.heif')):
-                return super().update_main_preview()
-                
-            temp_path = None
-            try:
-                temp_path = self._create_temp_preview(self.current_preview.image)
-                if temp_path:
-                    original_path = self.current_path
-                    self.current_path = temp_path
-                    super().update_main_preview()
-                    self.current_path = original_path
-                    from PyQt5.QtCore import QTimer
-                    QTimer.singleShot(1000, lambda p=temp_path: os.path.exists(p) and os.unlink(p))
-            except Exception as e:
-                if temp_path and os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise
+            # The base class scales the cached QImage from load_preview_image();
+            # no temp file is written and nothing is decoded again on resize
+            super().update_main_preview()
                 
         except Exception as e:
             error_msg = f"Error updating preview: {str(e)}"
@@ -236,15 +690,17 @@ class HEICConverterTool(BaseTool):
         if not hasattr(self, 'image_paths') or not self.image_paths:
             QMessageBox.warning(self, 'No Images', 'Please select at least one image to convert.')
             return
+        ensure_heif_opener()
             
         if not hasattr(self, 'output_dir') or not self.output_dir:
             QMessageBox.warning(self, 'No Output Directory', 'Please select an output directory.')
             return
             
         # Get conversion settings
-        output_format = self.format_combo.currentText().lower()
-        quality = int(self.quality_spin.currentText().split('(')[1].split(')')[0])
+        output_format = self.format_combo.currentText()  # Key of OUTPUT_FORMATS
+        quality = self.quality_spin.currentData()
         preserve_metadata = self.preserve_metadata.isChecked()
+        png_level = self.png_level_combo.currentData()
         
         # Disable controls during conversion
         self.set_controls_enabled(False)
@@ -258,7 +714,8 @@ class HEICConverterTool(BaseTool):
             self.output_dir,
             output_format,
             quality,
-            preserve_metadata
+            preserve_metadata,
+            png_level
         )
         
         # Connect signals
@@ -271,7 +728,8 @@ class HEICConverterTool(BaseTool):
     
     def set_controls_enabled(self, enabled: bool) -> None:
         """Enable or disable all controls."""
-        for control in ['file_controls', 'output_selector', 'format_combo', 'quality_spin', 'preserve_metadata']:
+        for control in ['file_controls', 'output_selector', 'format_combo', 'quality_spin',
+                        'png_level_combo', 'preserve_metadata']:
             if hasattr(self, control):
                 getattr(self, control).setEnabled(enabled)
         self.convert_btn.setEnabled(enabled and bool(getattr(self, 'image_paths', None)))
@@ -319,50 +777,197 @@ class HEICConversionWorker(QThread):
     error_occurred = pyqtSignal(str)
     
     def __init__(self, input_files: List[str], output_dir: str, output_format: str,
-                 quality: int, preserve_metadata: bool = True):
+                 quality: int, preserve_metadata: bool = True,
+                 png_level: int = PNG_COMPRESS_LEVEL):
         super().__init__()
         self.input_files = input_files
         self.output_dir = output_dir
         self.output_format = output_format
         self.quality = quality
         self.preserve_metadata = preserve_metadata
+        self.png_level = png_level
         self.is_running = True
     
     def run(self) -> None:
-        """Process all images in the input list."""
+        """Process all images in the input list, one file per CPU core at a time."""
         try:
             total = len(self.input_files)
-            for i, input_path in enumerate(self.input_files, 1):
-                if not self.is_running:
-                    break
-                try:
-                    self.convert_image(input_path)
-                    self.progress_updated.emit(i, total)
-                except Exception as e:
-                    name = os.path.basename(input_path)
-                    self.error_occurred.emit(f"Error converting {name}: {e}")
+            if not total:
+                self.finished.emit()
+                return
+            
+            # Decoding and encoding are CPU-bound and independent per file, so
+            # they run in separate processes; this thread only reports progress
+            # Every file goes to the same directory; create it once per batch
+            os.makedirs(self.output_dir, exist_ok=True)
+            
+            # About 50 progress updates per batch, however many files it has;
+            # each one wakes the GUI thread for the progress bar and status line
+            progress_step = max(1, total // 50)
+            
+            # Small batches leave cores idle, which libheif can use within a file
+            cpus = os.cpu_count() or 1
+            workers = min(cpus, total)
+            # Spawn rather than fork: the GUI process has thread-pool workers
+            # that may be inside libheif or Pillow, and forking them can deadlock
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_convert_process,
+                                     initargs=(cpus // workers,)) as executor:
+                queued = iter(self.input_files)
+                pending = {}  # future -> input path
+                completed = 0
+                while self.is_running:
+                    # Keep at most two files per worker in flight, so memory
+                    # and bookkeeping stay bounded however large the batch is
+                    while len(pending) < 2 * workers:
+                        path = next(queued, None)
+                        if path is None:
+                            break
+                        pending[executor.submit(_convert_one, self._task(path))] = path
+                    if not pending:
+                        break
+                    
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = pending.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            self.error_occurred.emit(f"Error converting {os.path.basename(path)}: {error}")
+                        completed += 1
+                        if completed % progress_step == 0 or completed == total:
+                            self.progress_updated.emit(completed, total)
+                
+                # Only reached with work left when the conversion was stopped
+                for future in pending:
+                    future.cancel()
             self.finished.emit()
         except Exception as e:
             self.error_occurred.emit(str(e))
     
+    def _task(self, input_path: str) -> tuple:
+        """Build the picklable argument tuple for _convert_one."""
+        return (input_path, self.output_dir, self.output_format,
+                self.quality, self.preserve_metadata, self.png_level)
+    
     def convert_image(self, input_path: str) -> None:
-        """Convert a single image to target format."""
-        try:
-            filename = f"{os.path.splitext(os.path.basename(input_path))[0]}.{self.output_format}"
-            output_path = os.path.join(self.output_dir, filename)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            with Image.open(input_path) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                is_jpeg = self.output_format == 'jpeg'
-                img.save(output_path, quality=self.quality,
-                        progressive=is_jpeg, optimize=is_jpeg)
-                        
-        except Exception as e:
-            raise Exception(f"Failed to convert {input_path}: {e}")
+        """Convert a single image to target format in the calling thread."""
+        _convert_one(self._task(input_path))
     
     def stop(self) -> None:
         """Stop the conversion process."""
         self.is_running = False
+
+
+class HEICThumbnailSignals(QObject):
+    """Signals for HEICThumbnailTask (QRunnable itself cannot emit)."""
+    done = pyqtSignal(int, int, QImage)  # batch, index, thumbnail image (null on failure)
+
+
+class HEICThumbnailTask(QRunnable):
+    """Decodes one gallery thumbnail on the global thread pool."""
+
+    def __init__(self, batch: int, index: int, path: str, cache_path: Optional[str] = None):
+        super().__init__()
+        self.batch = batch
+        self.index = index
+        self.path = path
+        self.cache_path = cache_path
+        self.signals = HEICThumbnailSignals()
+
+    def run(self) -> None:
+        # Only QImage is built here; QPixmap must be created on the GUI thread
+        if self.cache_path and os.path.exists(self.cache_path):
+            image = QImage(self.cache_path)
+            if not image.isNull():
+                self.signals.done.emit(self.batch, self.index, image)
+                return
+        self.signals.done.emit(self.batch, self.index, self._decode())
+
+    def _decode(self) -> QImage:
+        """Decode and shrink the source image, storing the result in the disk cache."""
+        try:
+            with Image.open(self.path) as img:
+                # Ask for twice the final size, keeping the aspect ratio: libjpeg
+                # then decodes at 1/2 to 1/8 scale, and pillow-heif's plugin
+                # switches to the smallest embedded preview (iPhone HEICs carry
+                # one) that still covers it. thumbnail() would only pass a
+                # square box, which a non-square preview never covers
+                scale = min(HEIC_THUMB_SIZE[0] / img.width, HEIC_THUMB_SIZE[1] / img.height)
+                if scale < 1:
+                    box = (max(1, round(img.width * scale * 2)), max(1, round(img.height * scale * 2)))
+                    img.draft(img.mode, box)
+                    if img.format == 'HEIF' and type(img).draft is Image.Image.draft:
+                        # Older pillow-heif plugins have no draft(); pick the
+                        # embedded preview through pillow-heif's own API instead
+                        img = self._embedded_thumbnail(box) or img
+                # In-place shrink; bilinear is indistinguishable from LANCZOS at
+                # 100x100 and about twice as fast
+                img.thumbnail(HEIC_THUMB_SIZE, Image.Resampling.BILINEAR)
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')  # Only the thumbnail-sized image
+                if self.cache_path:
+                    self._write_cache(img)
+                # Keep the buffer referenced until copy() detaches the QImage from it
+                data = img.tobytes()
+                return QImage(data, img.width, img.height, img.width * 3, QImage.Format_RGB888).copy()
+        except Exception as e:
+            print(f"Error creating thumbnail for {self.path}: {e}")
+            return QImage()
+
+    def _embedded_thumbnail(self, box):
+        """Return the smallest embedded HEIF preview covering box as a PIL image, or None."""
+        try:
+            heif = pillow_heif.open_heif(self.path, convert_hdr_to_8bit=True)
+            primary = heif[getattr(heif, 'primary_index', 0)]
+            thumbnails = getattr(primary, 'thumbnails', None)  # Older pillow-heif releases
+            if thumbnails is None:
+                if not hasattr(primary, 'get_thumbnail'):
+                    return None
+                thumbnails = [primary.get_thumbnail(i)
+                              for i in range(len(primary.info.get('thumbnails', [])))]
+            candidates = [t for t in thumbnails
+                          if t.mode == primary.mode and t.size[0] >= box[0] and t.size[1] >= box[1]]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda t: t.size[0] * t.size[1]).to_pillow()
+        except Exception as e:
+            print(f"Could not read embedded thumbnail of {self.path}: {e}")
+            return None
+
+    def _write_cache(self, img) -> None:
+        """Store the thumbnail for the next session; written to a temp name, then renamed."""
+        tmp_path = f"{self.cache_path}.{id(self)}.tmp"
+        try:
+            img.save(tmp_path, 'JPEG', quality=THUMB_CACHE_QUALITY)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not cache thumbnail for {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+class HEICMetadataSignals(QObject):
+    """Signals for HEICMetadataTask (QRunnable itself cannot emit)."""
+    done = pyqtSignal(dict)  # path -> (size_bytes, width, height, mode)
+
+
+class HEICMetadataTask(QRunnable):
+    """Reads file sizes and image headers for a selection on the global thread pool."""
+
+    def __init__(self, paths: List[str]):
+        super().__init__()
+        self.paths = paths
+        self.signals = HEICMetadataSignals()
+
+    def run(self) -> None:
+        meta = {}
+        for path in self.paths:
+            try:
+                size_bytes = os.stat(path).st_size
+                # Image.open only parses the header; no pixels are decoded here
+                with Image.open(path) as img:
+                    meta[path] = (size_bytes, img.width, img.height, img.mode)
+            except Exception as e:
+                print(f"Could not read header of {path}: {e}")
+        self.signals.done.emit(meta)
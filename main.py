@@ -1,5 +1,6 @@
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -12,65 +13,70 @@ from PyQt5.QtCore import Qt, QSize, pyqtSignal, pyqtSlot
 # Import theme
 from theme import apply_theme
 
-# Create QApplication first
-app = QApplication.instance() or QApplication(sys.argv)
-
-# Apply the theme
-apply_theme(app)
-
-# Import the tools
-try:
-    from resizer_tool import ResizerTool
-    from base64_tool import Base64Tool
-    from compressor_tool import CompressorTool
-    from webp_tool import WebPConverterTool
-    from cropper_tool import CropperTool
-    TOOLS_IMPORTED = True
-except ImportError as e:
-    print(f"Failed to import tools: {e}")
-    TOOLS_IMPORTED = False
-
-# Import remover tool if available
+# The tools are imported by _load_tools() rather than here: the HEIC
+# converter's worker processes import this module as __mp_main__, and must
+# not build a QApplication or load every tool (and onnxruntime) on the way
+TOOLS_IMPORTED = False
 REMBG_AVAILABLE = False
 REMBG_ERROR = ""
 RemoverTool = None
+HEIC_SUPPORT = False
+_tools_loaded = False
 
-try:
-    # First try to import onnxruntime directly to check if it's working
-    import onnxruntime as ort
-    print(f"ONNX Runtime version: {getattr(ort, '__version__', 'unknown')}")
-    
-    # Now try to import remover_tool
-    from remover_tool import RemoverTool, REMBG_AVAILABLE
-    
-    if REMBG_AVAILABLE:
-        print("Background Remover tool is available")
-    else:
-        print("Note: Background Remover tool is not available. Check console for details.")
-        
-except ImportError as e:
-    REMBG_ERROR = str(e)
-    print(f"Error importing remover tool: {e}")
-    import traceback
-    traceback.print_exc()
-    
-    if "No module named 'onnxruntime'" in REMBG_ERROR:
-        REMBG_ERROR = "onnxruntime is not installed. Please install it with: pip install onnxruntime"
-    elif "No module named 'rembg'" in REMBG_ERROR:
-        REMBG_ERROR = "rembg is not installed. Please install it with: pip install rembg"
 
-# Initialize HEIC support flag
-HEIC_SUPPORT = False
+def _load_tools() -> None:
+    """Import the tool modules once, after the QApplication exists."""
+    global _tools_loaded, TOOLS_IMPORTED, REMBG_AVAILABLE, REMBG_ERROR, HEIC_SUPPORT
+    global ResizerTool, Base64Tool, CompressorTool, WebPConverterTool, CropperTool
+    global RemoverTool, HEICConverterTool
+    if _tools_loaded:
+        return
+    _tools_loaded = True
 
-# Import HEIC tool only after QApplication is created
-try:
-    import pillow_heif
-    pillow_heif.register_heif_opener()
-    from heic_tool import HEICConverterTool
-    HEIC_SUPPORT = True
-except ImportError:
-    print("Warning: HEIC support is not available. Install pillow-heif for HEIC support.")
-    HEIC_SUPPORT = False
+    # Import the tools
+    try:
+        from resizer_tool import ResizerTool
+        from base64_tool import Base64Tool
+        from compressor_tool import CompressorTool
+        from webp_tool import WebPConverterTool
+        from cropper_tool import CropperTool
+        TOOLS_IMPORTED = True
+    except ImportError as e:
+        print(f"Failed to import tools: {e}")
+        TOOLS_IMPORTED = False
+
+    # Import remover tool if available
+    try:
+        # First try to import onnxruntime directly to check if it's working
+        import onnxruntime as ort
+        print(f"ONNX Runtime version: {getattr(ort, '__version__', 'unknown')}")
+        
+        # Now try to import remover_tool
+        from remover_tool import RemoverTool, REMBG_AVAILABLE
+        
+        if REMBG_AVAILABLE:
+            print("Background Remover tool is available")
+        else:
+            print("Note: Background Remover tool is not available. Check console for details.")
+            
+    except ImportError as e:
+        REMBG_ERROR = str(e)
+        print(f"Error importing remover tool: {e}")
+        import traceback
+        traceback.print_exc()
+        
+        if "No module named 'onnxruntime'" in REMBG_ERROR:
+            REMBG_ERROR = "onnxruntime is not installed. Please install it with: pip install onnxruntime"
+        elif "No module named 'rembg'" in REMBG_ERROR:
+            REMBG_ERROR = "rembg is not installed. Please install it with: pip install rembg"
+
+    # Import HEIC tool only after QApplication is created; pillow-heif itself is
+    # loaded by the tool the first time it handles a HEIC file
+    try:
+        from heic_tool import HEICConverterTool, HEIC_SUPPORT
+    except ImportError:
+        print("Warning: HEIC support is not available. Install pillow-heif for HEIC support.")
+        HEIC_SUPPORT = False
 
 class ImageToolTab(QWidget):
     """Container widget for image tools."""
@@ -105,6 +111,7 @@ class ImageMasterApp(QMainWindow):
     def __init__(self):
         """Initialize the application window."""
         super().__init__()
+        _load_tools()
         self.setWindowTitle("Image Master")
         self.setMinimumSize(1024, 768)  # Increased minimum size for better layout
         
@@ -306,6 +313,12 @@ class ImageMasterApp(QMainWindow):
 
 def main():
     """Main entry point for the application."""
+    # Create QApplication first
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    # Apply the theme
+    apply_theme(app)
+    
     # Create and show the main window
     window = ImageMasterApp()
     window.show()
@@ -314,4 +327,6 @@ def main():
     return app.exec_()
 
 if __name__ == "__main__":
+    # Lets the frozen executable start the HEIC converter's worker processes
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -9,10 +9,13 @@ from pathlib import Path
 import pytest
 from PyQt5.QtWidgets import QApplication
 
-# Initialize QApplication once for all tests
+from theme import apply_theme
+
+# Initialize QApplication once for all tests, styled as main() styles it
 app = QApplication.instance()
 if app is None:
     app = QApplication([])
+apply_theme(app)
 
 @pytest.fixture(scope="session")
 def test_data_dir():
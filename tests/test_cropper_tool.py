@@ -6,11 +6,14 @@ import sys
 import pytest
 from pathlib import Path
 from PyQt5.QtWidgets import QApplication, QPushButton, QLabel, QFileDialog, QWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QPoint, QRect, QThreadPool, QEvent
+from PyQt5.QtGui import QMouseEvent
 from PyQt5.QtTest import QTest
 
 # Import the CropperTool
-from cropper_tool import CropperTool, CropperThumbnailItem, CropArea
+from cropper_tool import (
+    CropperTool, CropperThumbnailItem, CropArea, CropSaveWorker, CROPPER_THUMB_IMG_WIDTH
+)
 
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / 'test_data'
@@ -117,6 +120,73 @@ class TestCropperTool:
                     assert (abs(actual - expected) < 1e-6 or 
                            abs(1/actual - 1/expected) < 1e-6)
     
+    def test_scrolling_keeps_thumbnail_timer_interval(self, cropper_tool):
+        """Test that scrolling the thumbnail strip does not change the load delay."""
+        scroll_bar = cropper_tool.thumbnail_scroll.horizontalScrollBar()
+        scroll_bar.setRange(0, 5000)
+        scroll_bar.setValue(3000)
+        assert cropper_tool._visible_thumbs_timer.interval() == 0
+        assert cropper_tool._visible_thumbs_timer.isActive()
+
+    def test_repeated_save_after_rotation_gives_same_crop(self, cropper_tool, monkeypatch, tmp_path):
+        """Test that saving twice keeps cropping from the loaded source, not the last crop."""
+        from PIL import Image
+        from PyQt5.QtWidgets import QMessageBox
+        monkeypatch.setattr(QMessageBox, 'information', lambda *args, **kwargs: None)
+        monkeypatch.setattr(QMessageBox, 'question', lambda *args, **kwargs: QMessageBox.Yes)
+        monkeypatch.setattr(QThreadPool, 'start', lambda pool, worker: worker.run())
+        image_path = tmp_path / "wide.png"
+        Image.new('RGB', (400, 200), 'red').save(image_path)
+        cropper_tool.output_dir = str(tmp_path)
+        cropper_tool.format_combo.setCurrentText("PNG")
+        cropper_tool.load_image_into_cropper(str(image_path))
+        source = cropper_tool.current_pil_image
+
+        crop_area = cropper_tool.crop_area
+        crop_area.rotate_image(90)
+        img_rect = crop_area.get_image_rect()
+        crop_area._set_selection(
+            img_rect.topLeft(),
+            QPoint(img_rect.left() + img_rect.width() // 2, img_rect.bottom())
+        )
+
+        sizes = []
+        for _ in range(2):
+            cropper_tool.crop_and_save()
+            with Image.open(next(tmp_path.glob("wide*_cropped.png"))) as saved:
+                sizes.append(saved.size)
+
+        assert sizes[0] == sizes[1]
+        assert cropper_tool.current_pil_image is source
+
+    def test_pixmap_fallback_source_is_unrotated(self, cropper_tool):
+        """Test that a source rebuilt from the pixmap after a rotation is cropped correctly."""
+        from PyQt5.QtGui import QPixmap, QPainter
+        pixmap = QPixmap(200, 100)
+        pixmap.fill(Qt.red)
+        painter = QPainter(pixmap)
+        painter.fillRect(100, 0, 100, 100, Qt.blue)
+        painter.end()
+        crop_area = cropper_tool.crop_area
+        crop_area.resize(400, 300)
+        crop_area.set_pixmap(pixmap)
+
+        # No file and no PIL image: the rotation handler rebuilds it from the pixmap
+        cropper_tool._handle_rotate_right()
+        source = cropper_tool.current_pil_image
+        assert source.size == (200, 100)
+        assert source.getpixel((0, 0)) == (255, 0, 0)
+
+        # The top half of the clockwise-rotated view is the red left half of the source
+        img_rect = crop_area.get_image_rect()
+        crop_area._set_selection(
+            img_rect.topLeft(),
+            QPoint(img_rect.right(), img_rect.top() + img_rect.height() // 2)
+        )
+        cropped = crop_area.crop_source_image(source)
+        assert all(abs(side - 100) <= 1 for side in cropped.size)
+        assert cropped.getextrema() == ((255, 255), (0, 0), (0, 0))
+
     def test_output_directory_selection(self, cropper_tool, monkeypatch, tmp_path):
         """Test selecting an output directory."""
         # Mock the file dialog to return a temporary directory
@@ -131,8 +201,133 @@ class TestCropperTool:
         assert cropper_tool.output_dir == test_dir
         assert test_dir in cropper_tool.output_dir_label.text()
 
+class TestCropArea:
+    """Test cases for the CropArea widget."""
+
+    @pytest.fixture
+    def crop_area(self, qapp):
+        """Fixture to provide a CropArea with a loaded image and selection."""
+        from PyQt5.QtGui import QPixmap
+        area = CropArea()
+        area.resize(400, 300)
+        pixmap = QPixmap(200, 100)
+        pixmap.fill(Qt.red)
+        area.set_pixmap(pixmap)
+        area.set_aspect_ratio(1, 1)
+        return area
+
+    def test_keyboard_moves_coalesce_crop_changed(self, crop_area):
+        """Test that a burst of moves results in a single crop_changed emission."""
+        emitted = []
+        crop_area.crop_changed.connect(emitted.append)
+
+        for _ in range(5):
+            crop_area.move_crop_area(1, 0)
+        assert emitted == []
+
+        QTest.qWait(50)
+        assert len(emitted) == 1
+        assert emitted[0] == crop_area.selection_rect()
+
+    def test_held_diagonal_keeps_moving_along_free_axis(self, crop_area):
+        """Test that an edge blocking one arrow key does not stop the other."""
+        img_rect = crop_area.get_image_rect()
+        start = QPoint(img_rect.left(), img_rect.top())
+        crop_area._set_selection(start, start + QPoint(40, 40))
+        crop_area.active_keys = {Qt.Key_Left, Qt.Key_Down}
+        crop_area.last_key_event = object()
+
+        crop_area.handle_key_repeat()
+        assert crop_area.start_pos == start + QPoint(0, 5)
+
+        # With an aspect ratio, Shift+Left+Down applies the shrink and the
+        # grow one axis at a time; a combined step dropped the vertical part
+        # and only shrank the box
+        width = crop_area._sel_rect.width()
+        crop_area.active_keys = {Qt.Key_Shift, Qt.Key_Left, Qt.Key_Down}
+        crop_area.handle_key_repeat()
+        assert crop_area._sel_rect.width() >= width
+
+    def test_drag_emits_crop_changed_only_on_release(self, crop_area):
+        """Test that dragging the selection emits crop_changed once, on release."""
+        emitted = []
+        crop_area.crop_changed.connect(emitted.append)
+        center = crop_area._sel_rect.center()
+
+        QTest.mousePress(crop_area, Qt.LeftButton, Qt.NoModifier, center)
+        for dx in range(1, 6):
+            # QTest.mouseMove does not deliver moves to a widget that was never
+            # shown, so send the drag events directly
+            QApplication.sendEvent(crop_area, QMouseEvent(
+                QEvent.MouseMove, center + QPoint(dx, 0), Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+        QTest.qWait(50)
+        assert emitted == []
+
+        QTest.mouseRelease(crop_area, Qt.LeftButton, Qt.NoModifier, center + QPoint(5, 0))
+        assert len(emitted) == 1
+
+        # Clicking without moving leaves the selection alone and emits nothing
+        center = crop_area._sel_rect.center()
+        QTest.mouseClick(crop_area, Qt.LeftButton, Qt.NoModifier, center)
+        assert len(emitted) == 1
+
+    def test_determine_resize_handle(self, crop_area):
+        """Test hit-testing of the resize handles."""
+        crop_area._set_selection(QPoint(100, 50), QPoint(200, 150))
+        sel_rect = QRect(crop_area.start_pos, crop_area.end_pos).normalized()
+
+        assert crop_area.determine_resize_handle(sel_rect.topLeft()) == 'top_left'
+        assert crop_area.determine_resize_handle(sel_rect.bottomRight()) == 'bottom_right'
+        assert crop_area.determine_resize_handle(QPoint(sel_rect.center().x(), sel_rect.top())) == 'top_middle'
+        assert crop_area.determine_resize_handle(sel_rect.center()) is None
+
+    def test_flip_is_deferred_to_crop(self, crop_area):
+        """Test that flipping leaves the pixmap alone and mirrors the saved crop."""
+        from PIL import Image
+        from PyQt5.QtGui import QPixmap, QPainter
+        pixmap = QPixmap(200, 100)
+        pixmap.fill(Qt.red)
+        painter = QPainter(pixmap)
+        painter.fillRect(100, 0, 100, 100, Qt.blue)
+        painter.end()
+        source = Image.new('RGB', (200, 100), 'red')
+        source.paste((0, 0, 255), (100, 0, 200, 100))
+        crop_area.set_pixmap(pixmap)
+        pixmap_key = crop_area.original_pixmap.cacheKey()
+
+        crop_area.flip_horizontal_image()
+        assert crop_area.original_pixmap.cacheKey() == pixmap_key
+
+        # The left quarter of the mirrored view shows the blue right edge of the source
+        img_rect = crop_area.get_image_rect()
+        crop_area._set_selection(
+            img_rect.topLeft(),
+            QPoint(img_rect.left() + img_rect.width() // 4, img_rect.bottom())
+        )
+        cropped = crop_area.crop_source_image(source)
+        assert cropped.getpixel((0, 0)) == (0, 0, 255)
+        assert crop_area.get_crop_as_numpy()[0, 0, 2] == 255
+
+    def test_get_crop_as_numpy(self, crop_area):
+        """Test that the numpy crop matches the selection and views the source."""
+        rect = crop_area.selection_rect()
+        crop = crop_area.get_crop_as_numpy()
+
+        assert crop.shape == (rect.height(), rect.width(), 4)
+        assert (crop[..., 0] == 255).all()  # Red fill in RGBA order
+        assert crop.base is not None  # A view, not a copy
+
 class TestCropperThumbnailItem:
     """Test cases for the CropperThumbnailItem class."""
+
+    @pytest.fixture(autouse=True)
+    def thumb_cache_dir(self, tmp_path, monkeypatch):
+        """Keep the thumbnail disk cache out of the user's real cache directory."""
+        import cropper_tool
+        cache_dir = tmp_path / "thumbs"
+        cache_dir.mkdir()
+        monkeypatch.setattr(cropper_tool, '_thumb_cache_dir', str(cache_dir))
+        return cache_dir
     
     def test_thumbnail_creation(self, qapp):
         """Test creating a thumbnail item."""
@@ -166,5 +361,59 @@ class TestCropperThumbnailItem:
         assert not thumbnail.is_selected
         assert thumbnail.property("selected") == False
 
+    def test_thumbnail_pixmap_is_cached(self, qapp, tmp_path):
+        """Test that a second item for the same file reuses the cached thumbnail."""
+        from PIL import Image
+        from PyQt5.QtGui import QPixmapCache
+        test_image = tmp_path / "cached.png"
+        Image.new('RGB', (300, 200), color='blue').save(test_image)
+
+        first = CropperThumbnailItem(str(test_image))
+        key = first._thumb_cache_key
+        assert key is not None
+        # The thumbnail is decoded on the thread pool and delivered via a queued signal
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        assert QPixmapCache.find(key) is not None
+
+        second = CropperThumbnailItem(str(test_image))
+        assert second._thumb_cache_key == key
+        assert second.image_label.pixmap().size() == first.image_label.pixmap().size()
+
+    def test_thumbnail_is_resampled_once(self, qapp, tmp_path):
+        """Test that thumbnails fit the box and small images are not rescaled."""
+        from PIL import Image
+        large = tmp_path / "large.png"
+        small = tmp_path / "small.png"
+        Image.new('RGB', (600, 300), color='green').save(large)
+        Image.new('RGB', (50, 40), color='green').save(small)
+
+        large_item = CropperThumbnailItem(str(large))
+        small_item = CropperThumbnailItem(str(small))
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
+        assert large_item.image_label.pixmap().width() == CROPPER_THUMB_IMG_WIDTH
+        assert large_item.image_label.pixmap().height() == CROPPER_THUMB_IMG_WIDTH // 2
+        assert small_item.image_label.pixmap().width() == 50
+        assert small_item.image_label.pixmap().height() == 40
+
+    def test_crop_save_worker_flattens_jpeg(self, qapp, tmp_path):
+        """Test that the save worker flattens alpha for JPEG and reports the saved path."""
+        from PIL import Image
+        output_path = str(tmp_path / "out_cropped.jpg")
+        results = []
+
+        worker = CropSaveWorker(Image.new('RGBA', (40, 30), (255, 0, 0, 128)), output_path, 'jpeg', {'quality': 90})
+        worker.signals.finished.connect(results.append)
+        worker.run()
+
+        assert worker.image is None
+        assert results == [output_path]
+        with Image.open(output_path) as saved:
+            assert saved.format == 'JPEG'
+            assert saved.mode == 'RGB'
+            assert saved.size == (40, 30)
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -53,6 +53,20 @@ class TestMainWindow:
             if bg_remover_tab is not None:
                 assert app.tabs.tabText(bg_remover_tab) == "BG Remover"
 
+    def test_main_module_import_has_no_side_effects(self):
+        """Test that re-running main.py as __mp_main__, as spawned workers do, stays cheap."""
+        import subprocess
+        import sys
+        main_path = Path(__file__).parent.parent / "main.py"
+        check = (
+            "import runpy, sys\n"
+            f"runpy.run_path({str(main_path)!r}, run_name='__mp_main__')\n"
+            "from PyQt5.QtWidgets import QApplication\n"
+            "assert QApplication.instance() is None\n"
+            "assert not {'cropper_tool', 'heic_tool', 'onnxruntime'} & set(sys.modules)\n"
+        )
+        subprocess.run([sys.executable, "-c", check], check=True, timeout=60)
+
 class TestResizerTab:
     """Test cases for the Resizer tab."""
     
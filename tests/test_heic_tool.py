@@ -0,0 +1,236 @@
+"""
+Tests for the HEIC Converter Tool functionality.
+"""
+import os
+import pytest
+from PIL import Image
+
+import heic_tool
+from heic_tool import (
+    HEICConverterTool, heic_thumb_cache_path, HEICThumbnailTask, HEIC_THUMB_SIZE,
+    HEICConversionWorker, ensure_heif_opener
+)
+
+@pytest.fixture(autouse=True)
+def thumb_cache_dir(tmp_path, monkeypatch):
+    """Keep the thumbnail disk cache out of the user's real cache directory."""
+    cache_dir = tmp_path / "heic_thumbs"
+    cache_dir.mkdir()
+    monkeypatch.setattr(heic_tool, '_thumb_cache_dir', str(cache_dir))
+    return cache_dir
+
+class TestHEICThumbnailCache:
+    """Test cases for the HEIC thumbnail disk cache."""
+
+    def test_cache_path_follows_file_changes(self, qapp, tmp_path, thumb_cache_dir):
+        """Test that the cache entry is stable for a file and changes when it is rewritten."""
+        image_path = tmp_path / "photo.png"
+        Image.new('RGB', (64, 48), color='red').save(image_path)
+
+        first = heic_thumb_cache_path(str(image_path))
+        assert first is not None
+        assert first.endswith('.jpg')
+        assert os.path.dirname(first) == str(thumb_cache_dir)
+        assert heic_thumb_cache_path(str(image_path)) == first
+
+        Image.new('RGB', (32, 24), color='blue').save(image_path)
+        os.utime(image_path, ns=(0, 10 ** 9))
+        assert heic_thumb_cache_path(str(image_path)) != first
+
+    def test_missing_file_has_no_cache_path(self, qapp, tmp_path):
+        """Test that a missing file does not get a cache entry."""
+        assert heic_thumb_cache_path(str(tmp_path / "missing.heic")) is None
+
+    def test_thumbnail_task_fills_cache(self, qapp, tmp_path):
+        """Test that a thumbnail task reports a scaled image and reuses its cache entry."""
+        image_path = tmp_path / "photo.png"
+        cache_path = str(tmp_path / "thumb.jpg")
+        Image.new('RGB', (400, 200), color='green').save(image_path)
+        results = []
+
+        for _ in range(2):
+            task = HEICThumbnailTask(1, 0, str(image_path), cache_path)
+            task.signals.done.connect(lambda batch, index, image: results.append(image))
+            task.run()
+            assert os.path.exists(cache_path)
+
+        assert [(image.width(), image.height()) for image in results] == [(HEIC_THUMB_SIZE[0], 50)] * 2
+
+    def test_thumbnail_task_decodes_heic(self, qapp, tmp_path):
+        """Test that a real HEIC file produces a thumbnail rather than an error."""
+        pytest.importorskip("pillow_heif")
+        assert ensure_heif_opener()
+        image_path = tmp_path / "photo.heic"
+        Image.new('RGB', (400, 300), color='green').save(image_path, format='HEIF')
+        results = []
+
+        task = HEICThumbnailTask(1, 0, str(image_path), str(tmp_path / "thumb.jpg"))
+        task.signals.done.connect(lambda batch, index, image: results.append(image))
+        task.run()
+
+        assert len(results) == 1
+        assert not results[0].isNull()
+        assert (results[0].width(), results[0].height()) == (HEIC_THUMB_SIZE[0], 75)
+
+    def test_thumbnail_uses_embedded_preview(self, qapp, tmp_path, monkeypatch):
+        """Test that a HEIC with an embedded preview is thumbnailed from that preview."""
+        pillow_heif = pytest.importorskip("pillow_heif")
+        assert ensure_heif_opener()
+        image_path = tmp_path / "photo.heic"
+        Image.new('RGB', (2000, 1500), color='green').save(image_path, format='HEIF', thumbnails=[256])
+        drafts = []
+        original = pillow_heif.HeifImageFile.draft
+
+        def draft(img, mode, size):
+            result = original(img, mode, size)
+            drafts.append(result)
+            return result
+
+        monkeypatch.setattr(pillow_heif.HeifImageFile, 'draft', draft)
+        results = []
+
+        task = HEICThumbnailTask(1, 0, str(image_path))
+        task.signals.done.connect(lambda batch, index, image: results.append(image))
+        task.run()
+
+        assert drafts and drafts[0] == ('RGB', (0, 0, 256, 192))
+        assert (results[0].width(), results[0].height()) == (HEIC_THUMB_SIZE[0], 75)
+
+    def test_thumbnail_uses_embedded_preview_without_plugin_draft(self, qapp, tmp_path, monkeypatch):
+        """Test that the embedded HEIF preview is used even when the plugin has no draft()."""
+        pillow_heif = pytest.importorskip("pillow_heif")
+        assert ensure_heif_opener()
+        image_path = tmp_path / "photo.heic"
+        Image.new('RGB', (2000, 1500), color='green').save(image_path, format='HEIF', thumbnails=[256])
+        monkeypatch.setattr(pillow_heif.HeifImageFile, 'draft', Image.Image.draft)
+        embedded_sizes = []
+        original = HEICThumbnailTask._embedded_thumbnail
+
+        def embedded_thumbnail(task, box):
+            img = original(task, box)
+            embedded_sizes.append(img.size)
+            return img
+
+        monkeypatch.setattr(HEICThumbnailTask, '_embedded_thumbnail', embedded_thumbnail)
+        results = []
+
+        task = HEICThumbnailTask(1, 0, str(image_path))
+        task.signals.done.connect(lambda batch, index, image: results.append(image))
+        task.run()
+
+        assert embedded_sizes == [(256, 192)]
+        assert (results[0].width(), results[0].height()) == (HEIC_THUMB_SIZE[0], 75)
+
+class TestHEICGallery:
+    """Test cases for the lazily loaded thumbnail gallery."""
+
+    def test_scrolling_keeps_thumbnail_timer_interval(self, qapp):
+        """Test that scrolling the gallery does not change the load delay."""
+        tool = HEICConverterTool()
+        scroll_bar = tool.thumbnail_gallery.scroll_area.verticalScrollBar()
+        scroll_bar.setRange(0, 5000)
+        scroll_bar.setValue(3000)
+        assert tool._visible_thumbs_timer.interval() == 50
+        assert tool._visible_thumbs_timer.isActive()
+
+class TestHEICPreviewCache:
+    """Test cases for the in-memory preview cache."""
+
+    def test_preview_is_decoded_once_per_version(self, qapp, tmp_path):
+        """Test that previews are reused until the file changes."""
+        tool = HEICConverterTool()
+        image_path = tmp_path / "photo.png"
+        Image.new('RGB', (64, 48), color='red').save(image_path)
+
+        first = tool._preview_data(str(image_path))
+        assert first is not None
+        assert (first.width, first.height) == (64, 48)
+        assert tool._preview_data(str(image_path)) is first
+
+        Image.new('RGB', (32, 24), color='blue').save(image_path)
+        os.utime(image_path, ns=(0, 10 ** 9))
+        second = tool._preview_data(str(image_path))
+        assert second is not first
+        assert (second.width, second.height) == (32, 24)
+
+    def test_preview_image_is_reused_across_resizes(self, qapp, tmp_path):
+        """Test that the preview hands back the same decoded QImage on every call."""
+        tool = HEICConverterTool()
+        image_path = tmp_path / "photo.png"
+        Image.new('RGB', (64, 48), color='red').save(image_path)
+        tool.current_path = str(image_path)
+
+        image = tool.load_preview_image()
+        assert (image.width(), image.height()) == (64, 48)
+        assert tool.load_preview_image() is image
+
+class TestHEICConversionWorker:
+    """Test cases for the batch conversion worker and its process pool."""
+
+    def _run(self, inputs, output_dir, output_format):
+        """Run a worker to completion on the calling thread and collect its signals."""
+        worker = HEICConversionWorker([str(path) for path in inputs], str(output_dir),
+                                      output_format, 85, True)
+        progress, errors, finished = [], [], []
+        worker.progress_updated.connect(lambda current, total: progress.append((current, total)))
+        worker.error_occurred.connect(errors.append)
+        worker.finished.connect(lambda: finished.append(True))
+        worker.run()
+        return progress, errors, finished
+
+    def test_converts_batch_to_jpeg(self, qapp, tmp_path):
+        """Test that a batch is converted to JPEG in the worker processes."""
+        pytest.importorskip("pillow_heif")
+        assert ensure_heif_opener()
+        heic_path = tmp_path / "photo.heic"
+        exif = Image.Exif()
+        exif[0x010F] = "ImageMaster"  # Make
+        Image.new('RGB', (64, 48), color='green').save(heic_path, format='HEIF', exif=exif)
+        png_path = tmp_path / "overlay.png"
+        Image.new('RGBA', (32, 24), color=(255, 0, 0, 128)).save(png_path)
+        output_dir = tmp_path / "out"
+
+        progress, errors, finished = self._run([heic_path, png_path], output_dir, 'JPEG')
+
+        assert errors == []
+        assert finished == [True]
+        assert progress[-1] == (2, 2)
+        with Image.open(output_dir / "photo.jpg") as img:
+            assert (img.format, img.mode, img.size) == ('JPEG', 'RGB', (64, 48))
+            assert img.getexif().get(0x010F) == "ImageMaster"
+        with Image.open(output_dir / "overlay.jpg") as img:
+            assert (img.format, img.mode, img.size) == ('JPEG', 'RGB', (32, 24))
+
+    def test_converts_batch_to_png(self, qapp, tmp_path):
+        """Test that PNG output keeps the alpha channel."""
+        png_path = tmp_path / "overlay.png"
+        Image.new('RGBA', (32, 24), color=(255, 0, 0, 128)).save(png_path)
+        output_dir = tmp_path / "out"
+
+        progress, errors, finished = self._run([png_path], output_dir, 'PNG')
+
+        assert errors == []
+        assert finished == [True]
+        assert progress == [(1, 1)]
+        with Image.open(output_dir / "overlay.png") as img:
+            assert (img.mode, img.size) == ('RGBA', (32, 24))
+            assert img.getpixel((0, 0)) == (255, 0, 0, 128)
+
+    def test_reports_unreadable_file(self, qapp, tmp_path):
+        """Test that a file that fails to convert is reported without stopping the batch."""
+        bad_path = tmp_path / "broken.png"
+        bad_path.write_bytes(b"not an image")
+        good_path = tmp_path / "good.png"
+        Image.new('RGB', (8, 8), color='blue').save(good_path)
+        output_dir = tmp_path / "out"
+
+        progress, errors, finished = self._run([bad_path, good_path], output_dir, 'JPEG')
+
+        assert len(errors) == 1
+        assert "broken.png" in errors[0]
+        assert finished == [True]
+        assert progress[-1] == (2, 2)
+        assert (output_dir / "good.jpg").exists()
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
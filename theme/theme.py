@@ -237,6 +237,36 @@ def get_theme_stylesheet():
         color: #e2e8f0;
     }
     
+    /* Cropper Tool specific styles */
+    QLabel#CropArea {
+        background-color: #f8f9fa;
+        border: 1px solid #e2e8f0;
+        border-radius: 8px;
+    }
+    
+    QLabel#CropArea QToolButton {
+        background-color: #4f46e5;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        margin: 2px;
+    }
+    
+    QLabel#CropArea QToolButton:hover {
+        background-color: #4338ca;
+    }
+    
+    QLabel#CropArea QToolButton:pressed {
+        background-color: #3730a3;
+    }
+    
+    QLabel#CropArea QLabel {
+        color: #4b5563;
+        font-size: 12px;
+        margin: 4px 0;
+    }
+    
     /* Menu bar */
     QMenuBar {
         background-color: white;
@@ -2,7 +2,7 @@
 Base tool class that provides common functionality for all image processing tools.
 """
 import os
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -194,25 +194,27 @@ class BaseTool(QWidget):
                 return  # Not ready to render yet
                 
             # Load the image
-            pixmap = QPixmap(self.current_path)
-            if pixmap.isNull():
+            source = self.load_preview_image()
+            if source.isNull():
                 self.main_preview.setText("Failed to load image")
                 return
                 
             # Calculate the scaled size maintaining aspect ratio
-            pixmap_size = pixmap.size()
-            pixmap_size.scale(available_size, Qt.KeepAspectRatio)
+            source_size = source.size()
+            source_size.scale(available_size, Qt.KeepAspectRatio)
             
             # Only scale if necessary to avoid unnecessary scaling operations
-            if pixmap_size != pixmap.size():
-                pixmap = pixmap.scaled(
+            if source_size != source.size():
+                source = source.scaled(
                     available_size,
                     Qt.KeepAspectRatio,
                     Qt.SmoothTransformation
                 )
             
             # Set the pixmap
-            self.main_preview.setPixmap(pixmap)
+            if isinstance(source, QImage):
+                source = QPixmap.fromImage(source)
+            self.main_preview.setPixmap(source)
             
             # Update size and file info
             img = self.current_preview
@@ -226,6 +228,17 @@ class BaseTool(QWidget):
             self.error_occurred.emit(f"Error updating preview: {str(e)}")
             self.size_info.setText("Error loading image")
     
+    def load_preview_image(self) -> Union[QPixmap, QImage]:
+        """Return the full image shown, scaled to fit, in the main preview.
+        
+        Subclasses can override this to supply an image they have already
+        decoded, so resizing the window does not read the file again.
+        
+        Returns:
+            The image for the current path (null if it cannot be read)
+        """
+        return QPixmap(self.current_path)
+    
     def process_images(self) -> None:
         """Process all selected images."""
         if not self.image_paths:
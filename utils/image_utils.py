@@ -64,8 +64,10 @@ class ImageData:
                 if hasattr(img, '_getexif') and img._getexif():
                     metadata['exif'] = dict(img._getexif())
                 
+                # The pixels are already loaded (or freshly converted), and
+                # leaving the with block only closes the file, so no copy
                 return cls(
-                    image=img.copy(),
+                    image=img,
                     path=path,
                     width=img.width,
                     height=img.height,
@@ -114,11 +114,17 @@ class ImagePreviewGallery(QWidget):
     
     def clear(self) -> None:
         """Clear all thumbnails from the gallery."""
-        # Clear the layout
-        while self.grid_layout.count() > 0:
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Clear the layout from the back: takeAt(0) shifts every remaining
+        # item, which made clearing a large grid quadratic. Repaints are held
+        # until the whole grid is gone
+        self.container.setUpdatesEnabled(False)
+        try:
+            for index in reversed(range(self.grid_layout.count())):
+                item = self.grid_layout.takeAt(index)
+                if item.widget():
+                    item.widget().deleteLater()
+        finally:
+            self.container.setUpdatesEnabled(True)
         
         # Clear the thumbnails dictionary
         self.thumbnails.clear()
@@ -144,34 +150,74 @@ class ImagePreviewGallery(QWidget):
                 # Create a thumbnail
                 img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
                 
-                # Convert to QPixmap and set
-                if img.mode == 'RGB':
-                    qimage = QImage(img.tobytes(), img.width, img.height, QImage.Format_RGB888)
-                else:
-                    # Convert to RGB if not already
+                # Convert to RGB if not already
+                if img.mode != 'RGB':
                     img = img.convert('RGB')
-                    qimage = QImage(img.tobytes(), img.width, img.height, QImage.Format_RGB888)
-                
-                pixmap = QPixmap.fromImage(qimage)
-                thumbnail.setPixmap(pixmap)
-                
-                # Store the path as a property
-                thumbnail.path = path
                 
-                # Connect click event
-                thumbnail.mousePressEvent = lambda e, p=path: self.on_thumbnail_clicked(p)
+                # Wrap the raw bytes without a copy; rows are tightly packed, so
+                # pass bytesPerLine instead of Qt's 32-bit aligned default.
+                # fromImage() makes the only copy, after which data can go
+                data = img.tobytes()
+                qimage = QImage(data, img.width, img.height, img.width * 3, QImage.Format_RGB888)
+                thumbnail.setPixmap(QPixmap.fromImage(qimage))
                 
-                # Add to layout - use 3 columns for larger thumbnails
-                position = len(self.thumbnails)
-                row = position // 3  # 3 columns
-                col = position % 3
-                
-                self.grid_layout.addWidget(thumbnail, row, col)
-                self.thumbnails[path] = thumbnail
+                self._place_thumbnail(path, thumbnail)
                 
         except Exception as e:
             print(f"Error creating thumbnail for {path}: {e}")
     
+    def add_placeholder(self, path: str) -> ThumbnailLabel:
+        """Add an empty thumbnail slot for the given image path.
+        
+        The slot keeps its grid position while the image is decoded
+        elsewhere; fill it with set_thumbnail_image().
+        
+        Args:
+            path: Path to the image file.
+            
+        Returns:
+            ThumbnailLabel: The slot for the path (an existing one if already added).
+        """
+        if path in self.thumbnails:
+            return self.thumbnails[path]
+        
+        thumbnail = ThumbnailLabel()
+        thumbnail.setMinimumSize(60, 60)
+        thumbnail.setText("...")
+        self._place_thumbnail(path, thumbnail)
+        return thumbnail
+    
+    def set_thumbnail_image(self, path: str, image: QImage) -> None:
+        """Show a decoded thumbnail in the slot for the given path.
+        
+        Args:
+            path: Path to the image file.
+            image: Decoded thumbnail; a null image marks the slot as failed.
+        """
+        thumbnail = self.thumbnails.get(path)
+        if thumbnail is None:
+            return
+        if image.isNull():
+            thumbnail.setText("Error")
+        else:
+            thumbnail.setPixmap(QPixmap.fromImage(image))
+    
+    def _place_thumbnail(self, path: str, thumbnail: ThumbnailLabel) -> None:
+        """Register a thumbnail widget for a path and put it in the next grid cell."""
+        # Store the path as a property
+        thumbnail.path = path
+        
+        # Connect click event
+        thumbnail.mousePressEvent = lambda e, p=path: self.on_thumbnail_clicked(p)
+        
+        # Add to layout - use 3 columns for larger thumbnails
+        position = len(self.thumbnails)
+        row = position // 3  # 3 columns
+        col = position % 3
+        
+        self.grid_layout.addWidget(thumbnail, row, col)
+        self.thumbnails[path] = thumbnail
+    
     @pyqtSlot(str)
     def on_thumbnail_clicked(self, path: str) -> None:
         """Handle thumbnail click events.